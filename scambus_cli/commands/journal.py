@@ -15,6 +15,7 @@ from scambus_cli.utils import (
     print_success,
     print_table,
     print_warning,
+    run_async,
 )
 
 
@@ -437,7 +438,6 @@ def query(
 
         # Follow mode: create stream and subscribe via WebSocket
         if follow:
-            import asyncio
             from scambus_client.websocket_client import ScambusWebSocketClient
             from scambus_cli.config import get_api_url
             import time
@@ -496,7 +496,7 @@ def query(
                         print_detail(entry_summary)
 
                 # Run WebSocket listener
-                asyncio.run(
+                run_async(
                     ws_client.listen_stream(
                         stream_id=stream.id,
                         on_message=handle_new_entry,
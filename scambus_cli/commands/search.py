@@ -4,7 +4,7 @@ import sys
 
 import click
 
-from scambus_cli.utils import print_error, print_info, print_json, print_table
+from scambus_cli.utils import print_error, print_info, print_json, print_table, run_async
 
 
 @click.group()
@@ -87,7 +87,6 @@ def identifiers(
             print_error("--type is required when using --follow")
             sys.exit(1)
 
-        import asyncio
         from scambus_client.websocket_client import ScambusWebSocketClient
         from scambus_cli.config import get_api_url
         from scambus_cli.auth_device import DeviceAuthManager
@@ -137,7 +136,7 @@ def identifiers(
                 print_error(f"WebSocket error: {error}")
 
             # Run WebSocket client
-            asyncio.run(
+            run_async(
                 ws_client.listen_stream(
                     stream_id=stream_id,
                     on_message=handle_message,
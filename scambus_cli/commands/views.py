@@ -12,6 +12,7 @@ from scambus_cli.utils import (
     print_json,
     print_success,
     print_table,
+    run_async,
 )
 
 
@@ -223,7 +224,6 @@ def execute_view(ctx, view_id, limit, cursor, follow, output_json):
                 print_error("Follow mode is only supported for journal entity views")
                 sys.exit(1)
 
-            import asyncio
             from scambus_client.websocket_client import ScambusWebSocketClient
             from scambus_cli.config import get_api_url
             import time
@@ -277,7 +277,7 @@ def execute_view(ctx, view_id, limit, cursor, follow, output_json):
                         print_detail(entry_summary)
 
                 # Run WebSocket listener
-                asyncio.run(
+                run_async(
                     ws_client.listen_stream(
                         stream_id=stream.id,
                         on_message=handle_new_entry,
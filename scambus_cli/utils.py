@@ -1,6 +1,8 @@
 """Utility functions for CLI output."""
 
+import asyncio
 import json
+import sys
 
 from rich.console import Console
 from rich.table import Table
@@ -68,3 +70,23 @@ def print_detail(data, title=None):
 def print_json(data):
     """Print data as JSON to stdout."""
     console_data.print_json(data=data)
+
+
+def run_async(coro):
+    """Run a coroutine to completion, on a uvloop event loop when uvloop is installed.
+
+    The CLI owns its process, so this is where the event loop implementation is
+    chosen; the client library never changes global asyncio state.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+
+    # No loop factory before Python 3.11; the policy only affects this CLI process
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
@@ -17,6 +17,8 @@ from .client import (
     build_combined_filter,
 )
 from .exceptions import (
+    InvalidConfidenceError,
+    InvalidIdentifierTypeError,
     ScambusAPIError,
     ScambusAuthenticationError,
     ScambusNotFoundError,
@@ -113,6 +115,8 @@ __all__ = [
     "ScambusValidationError",
     "ScambusNotFoundError",
     "ScambusServerError",
+    "InvalidIdentifierTypeError",
+    "InvalidConfidenceError",
     "FilterCriteria",
     "IdentifierType",
     "JournalEntryType",
@@ -2,13 +2,14 @@
 Main Scambus API client.
 """
 
+import functools
 import logging
 import random
 import time
 import warnings
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,8 @@ from requests.adapters import HTTPAdapter  # noqa: used for max_retries=0 mount
 from .config import get_api_url, get_api_token, get_api_key_id, get_api_key_secret
 
 from .exceptions import (
+    InvalidConfidenceError,
+    InvalidIdentifierTypeError,
     ScambusAPIError,
     ScambusAuthenticationError,
     ScambusNotFoundError,
@@ -95,6 +98,55 @@ from .types import (
     to_dict_list,
 )
 
+# Identifier types accepted by the filter expression builders.
+_VALID_IDENTIFIER_TYPES = frozenset(
+    {
+        "phone",
+        "email",
+        "url",
+        "bank_account",
+        "crypto_wallet",
+        "social_media",
+        "payment_token",
+        "zelle",
+    }
+)
+
+# Fixed fragments of the identifier type filter expressions. Type names are
+# validated against _VALID_IDENTIFIER_TYPES, so they can be joined in verbatim.
+_ID_TYPE_PREFIX = '$.type == "'
+_ID_TYPE_SEP = '" || $.type == "'
+_JE_TYPE_PREFIX = 'exists($.identifiers[*] ? (@.type == "'
+_JE_TYPE_SEP = '" || @.type == "'
+_JE_TYPE_SUFFIX = '"))'
+
+
+def _identifier_type_expression(identifier_types: Tuple[str, ...]) -> str:
+    """For identifier streams: check the top-level type field."""
+    return _ID_TYPE_PREFIX + _ID_TYPE_SEP.join(identifier_types) + '"'
+
+
+def _journal_entry_type_expression(identifier_types: Tuple[str, ...]) -> str:
+    """For journal entry streams: check the identifiers array.
+
+    Uses the SQL/JSON Path exists() predicate to match if any identifier has one of the types.
+    """
+    return _JE_TYPE_PREFIX + _JE_TYPE_SEP.join(identifier_types) + _JE_TYPE_SUFFIX
+
+
+# Stream data_type -> expression builder, so the data_type branch is one dict lookup
+_TYPE_FILTER_BUILDERS = {
+    "identifier": _identifier_type_expression,
+    "journal_entry": _journal_entry_type_expression,
+}
+
+# Precomputed expressions for the common single-type call, keyed by (type, data_type)
+_SINGLE_TYPE_FILTERS = {
+    (itype, data_type): builder((itype,))
+    for itype in _VALID_IDENTIFIER_TYPES
+    for data_type, builder in _TYPE_FILTER_BUILDERS.items()
+}
+
 
 def build_identifier_type_filter(
     identifier_types: Union[str, List[str]], data_type: str = "identifier"
@@ -133,50 +185,45 @@ def build_identifier_type_filter(
         'exists($.identifiers[*] ? (@.type == "phone" || @.type == "email"))'
     """
     if isinstance(identifier_types, str):
-        identifier_types = [identifier_types]
-
+        expression = _SINGLE_TYPE_FILTERS.get((identifier_types, data_type))
+        if expression is not None:
+            return expression
+        # Unknown type or data_type: fall through so the builder raises the usual error
+        identifier_types = (identifier_types,)
+    return _build_identifier_type_filter(tuple(identifier_types), data_type)
+
+
+# Filters are usually built from a handful of fixed type lists, so the expression
+# for each (types, data_type) pair is generated once and then served from the cache.
+# Type order is kept in the key because it is reflected in the expression.
+@functools.lru_cache(maxsize=256, typed=True)
+def _build_identifier_type_filter(identifier_types: Tuple[str, ...], data_type: str) -> str:
+    """Build the filter expression for normalized identifier types (see public wrapper)."""
     if not identifier_types:
         raise ValueError("identifier_types cannot be empty")
 
     # Validate types
-    valid_types = {
-        "phone",
-        "email",
-        "url",
-        "bank_account",
-        "crypto_wallet",
-        "social_media",
-        "payment_token",
-        "zelle",
-    }
-    for itype in identifier_types:
-        if itype not in valid_types:
-            raise ValueError(
-                f"Invalid identifier type: {itype}. "
-                f"Valid types are: {', '.join(sorted(valid_types))}"
-            )
+    if not _VALID_IDENTIFIER_TYPES.issuperset(identifier_types):
+        itype = next(t for t in identifier_types if t not in _VALID_IDENTIFIER_TYPES)
+        raise InvalidIdentifierTypeError(
+            f"Invalid identifier type: {itype}. "
+            f"Valid types are: {', '.join(sorted(_VALID_IDENTIFIER_TYPES))}"
+        )
 
     # Build filter expression based on data_type
-    if data_type == "identifier":
-        # For identifier streams: check top-level type field
-        if len(identifier_types) == 1:
-            return f'$.type == "{identifier_types[0]}"'
-        else:
-            conditions = [f'$.type == "{itype}"' for itype in identifier_types]
-            return " || ".join(conditions)
-    elif data_type == "journal_entry":
-        # For journal entry streams: check identifiers array
-        # Use SQL/JSON Path exists() predicate to check if any identifier matches
-        if len(identifier_types) == 1:
-            return f'exists($.identifiers[*] ? (@.type == "{identifier_types[0]}"))'
-        else:
-            conditions = [f'@.type == "{itype}"' for itype in identifier_types]
-            inner_condition = " || ".join(conditions)
-            return f"exists($.identifiers[*] ? ({inner_condition}))"
-    else:
+    builder = _TYPE_FILTER_BUILDERS.get(data_type)
+    if builder is None:
         raise ValueError(
             f"Invalid data_type: {data_type}. Valid types are: identifier, journal_entry"
         )
+    return builder(identifier_types)
+
+
+# Confidence clauses for build_combined_filter. For journal entry streams,
+# confidence is stored in the min_confidence field.
+_CONFIDENCE_FIELDS = {"journal_entry": "$.min_confidence"}
+_MIN_CONFIDENCE_CLAUSE = "{} >= {}".format
+_MAX_CONFIDENCE_CLAUSE = "{} <= {}".format
 
 
 def build_combined_filter(
@@ -219,34 +266,65 @@ def build_combined_filter(
         >>> build_combined_filter(custom_expression='$.details.platform == "whatsapp"')
         '$.details.platform == "whatsapp"'
     """
+    # Nothing requested: skip normalization and the cache lookup entirely
+    if (
+        not identifier_types
+        and min_confidence is None
+        and max_confidence is None
+        and not custom_expression
+    ):
+        return None
+
+    if isinstance(identifier_types, str):
+        identifier_types = (identifier_types,)
+    elif identifier_types is not None:
+        identifier_types = tuple(identifier_types)
+    return _build_combined_filter(
+        identifier_types, min_confidence, max_confidence, custom_expression, data_type
+    )
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _build_combined_filter(
+    identifier_types: Optional[Tuple[str, ...]],
+    min_confidence: Optional[float],
+    max_confidence: Optional[float],
+    custom_expression: Optional[str],
+    data_type: str,
+) -> Optional[str]:
+    """Build the combined filter expression for normalized arguments (see public wrapper)."""
+    # Validate the confidence bounds up front: one chained comparison per bound
+    if min_confidence is not None and not 0 <= min_confidence <= 1:
+        raise InvalidConfidenceError(
+            f"min_confidence must be between 0 and 1, got {min_confidence}"
+        )
+    if max_confidence is not None and not 0 <= max_confidence <= 1:
+        raise InvalidConfidenceError(
+            f"max_confidence must be between 0 and 1, got {max_confidence}"
+        )
+    if min_confidence is not None and max_confidence is not None:
+        if min_confidence > max_confidence:
+            raise InvalidConfidenceError(
+                f"min_confidence ({min_confidence}) cannot be greater than "
+                f"max_confidence ({max_confidence})"
+            )
+
     conditions = []
 
     # Add identifier type filter
     if identifier_types:
-        type_filter = build_identifier_type_filter(identifier_types, data_type=data_type)
+        type_filter = _build_identifier_type_filter(identifier_types, data_type)
         # Wrap in parentheses if multiple types (for proper AND precedence)
-        if isinstance(identifier_types, list) and len(identifier_types) > 1:
+        if len(identifier_types) > 1:
             type_filter = f"({type_filter})"
         conditions.append(type_filter)
 
     # Add confidence filters
+    confidence_field = _CONFIDENCE_FIELDS.get(data_type, "$.confidence")
     if min_confidence is not None:
-        if not 0 <= min_confidence <= 1:
-            raise ValueError("min_confidence must be between 0 and 1")
-        # For journal entry streams, confidence is stored in min_confidence field
-        if data_type == "journal_entry":
-            conditions.append(f"$.min_confidence >= {min_confidence}")
-        else:
-            conditions.append(f"$.confidence >= {min_confidence}")
-
+        conditions.append(_MIN_CONFIDENCE_CLAUSE(confidence_field, min_confidence))
     if max_confidence is not None:
-        if not 0 <= max_confidence <= 1:
-            raise ValueError("max_confidence must be between 0 and 1")
-        # For journal entry streams, confidence is stored in min_confidence field
-        if data_type == "journal_entry":
-            conditions.append(f"$.min_confidence <= {max_confidence}")
-        else:
-            conditions.append(f"$.confidence <= {max_confidence}")
+        conditions.append(_MAX_CONFIDENCE_CLAUSE(confidence_field, max_confidence))
 
     # Add custom expression
     if custom_expression:
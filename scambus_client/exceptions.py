@@ -34,3 +34,15 @@ class ScambusServerError(ScambusAPIError):
     """Raised when the server returns a 5xx error."""
 
     pass
+
+
+class InvalidIdentifierTypeError(ValueError):
+    """Raised by the filter builders for an identifier type they do not recognize."""
+
+    pass
+
+
+class InvalidConfidenceError(ValueError):
+    """Raised by the filter builders for a confidence bound outside 0-1 or an inverted range."""
+
+    pass
@@ -1,7 +1,13 @@
 """
 Data models for the Scambus API.
+
+Models are plain stdlib dataclasses so the client has no serialization dependencies
+beyond ``requests`` and ``websockets``. Hot decode paths are kept cheap inside
+``from_dict`` itself (e.g. lazily parsed timestamps) rather than by swapping the
+model base for ``attrs`` or ``msgspec``.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -16,6 +22,52 @@ def _get_value(data: Dict[str, Any], snake_key: str, camel_key: str, default: An
     return default
 
 
+def _parse_datetime(dt_str: Optional[str]) -> Optional[datetime]:
+    """Parse ISO datetime string, handling both with and without timezone."""
+    if not dt_str:
+        return None
+    # Replace Z with +00:00 for proper parsing
+    dt_str = dt_str.replace("Z", "+00:00")
+    # If no timezone info, assume UTC
+    if "+" not in dt_str and dt_str.count(":") >= 2:
+        dt_str = dt_str + "+00:00"
+    return datetime.fromisoformat(dt_str)
+
+
+def _intern(value: Any) -> Any:
+    """Intern a closed-set string value so large result sets share one object per value."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _LazyDatetime:
+    """
+    Dataclass field descriptor that defers ISO datetime parsing until first access.
+
+    The raw value is stored on the instance under ``_<name>_raw``; a string is parsed
+    on first read and the resulting datetime replaces it, so parsing happens at most once.
+
+    The format is not checked at decode time: ``from_dict`` accepts a malformed timestamp,
+    and the ``ValueError`` from :meth:`datetime.fromisoformat` is raised when the field is
+    first read (and again on every later read, since the raw string is kept).
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._slot = f"_{name}_raw"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Optional[datetime]:
+        if instance is None:
+            # Class-level access: dataclass reads this as the field default
+            return None
+        value = instance.__dict__.get(self._slot)
+        if isinstance(value, str):
+            value = _parse_datetime(value)
+            instance.__dict__[self._slot] = value
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self._slot] = value
+
+
 @dataclass
 class EnrichedDetailField:
     """Enrichment value with source attribution."""
@@ -226,9 +278,9 @@ class BatchCreateResult:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BatchCreateResult":
         """Create from API response dictionary."""
-        summary = data.get("summary", {})
+        summary = data.get("summary") or {}
         return cls(
-            results=[BatchEntryResult.from_dict(r) for r in data.get("results", [])],
+            results=[BatchEntryResult.from_dict(r) for r in (data.get("results") or [])],
             total=summary.get("total", 0),
             succeeded=summary.get("succeeded", 0),
             failed=summary.get("failed", 0),
@@ -266,26 +318,17 @@ class Identifier:
 
         return cls(
             id=data["id"],
-            type=data["type"],
+            type=_intern(data["type"]),
             display_value=_get_value(data, "display_value", "displayValue", ""),
             confidence=confidence,
             data=data.get("data"),
-            created_at=cls._parse_datetime(_get_value(data, "created_at", "createdAt")),
-            updated_at=cls._parse_datetime(_get_value(data, "updated_at", "updatedAt")),
+            created_at=_parse_datetime(_get_value(data, "created_at", "createdAt")),
+            updated_at=_parse_datetime(_get_value(data, "updated_at", "updatedAt")),
             is_test=_get_value(data, "is_test", "isTest", False),
         )
 
-    @staticmethod
-    def _parse_datetime(dt_str: Optional[str]) -> Optional[datetime]:
-        """Parse ISO datetime string, handling both with and without timezone."""
-        if not dt_str:
-            return None
-        # Replace Z with +00:00 for proper parsing
-        dt_str = dt_str.replace("Z", "+00:00")
-        # If no timezone info, assume UTC
-        if "+" not in dt_str and dt_str.count(":") >= 2:
-            dt_str = dt_str + "+00:00"
-        return datetime.fromisoformat(dt_str)
+    # Kept for backward compatibility; decoders call the module-level function directly
+    _parse_datetime = staticmethod(_parse_datetime)
 
 
 @dataclass
@@ -326,10 +369,10 @@ class Evidence:
             title=data["title"],
             description=data.get("description"),
             source=data.get("source"),
-            collected_at=Identifier._parse_datetime(data.get("collected_at")),
-            media_ids=data.get("media_ids", []),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
-            updated_at=Identifier._parse_datetime(data.get("updated_at")),
+            collected_at=_parse_datetime(data.get("collected_at")),
+            media_ids=data.get("media_ids") or [],
+            created_at=_parse_datetime(data.get("created_at")),
+            updated_at=_parse_datetime(data.get("updated_at")),
             is_test=data.get("is_test", False),
         )
 
@@ -368,7 +411,7 @@ class Media:
             mime_type=_get_value(data, "mime_type", "mimeType", ""),
             file_size=_get_value(data, "file_size", "fileSize", 0),
             notes=data.get("notes"),
-            uploaded_at=Identifier._parse_datetime(_get_value(data, "uploaded_at", "uploadedAt")),
+            uploaded_at=_parse_datetime(_get_value(data, "uploaded_at", "uploadedAt")),
             journal_entry_id=_get_value(data, "journal_entry_id", "journalEntryId"),
         )
 
@@ -851,9 +894,7 @@ class ConversationContinuationDetails:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ConversationContinuationDetails":
         """Create from API response dictionary."""
-        messages = [
-            ConversationMessage.from_dict(m) for m in data.get("messages", [])
-        ]
+        messages = [ConversationMessage.from_dict(m) for m in (data.get("messages") or [])]
         return cls(
             messages=messages,
             reason=data.get("reason"),
@@ -1581,7 +1622,7 @@ class KarmaBreakdown:
     def from_dict(cls, data: Dict[str, Any]) -> "KarmaBreakdown":
         """Create from API response dictionary."""
         return cls(
-            components=[KarmaComponent.from_dict(c) for c in data.get("components", [])],
+            components=[KarmaComponent.from_dict(c) for c in (data.get("components") or [])],
             total=data.get("total", 0),
         )
 
@@ -1661,11 +1702,11 @@ class JournalEntryChildSummary:
         """Create from API response dictionary."""
         return cls(
             id=data["id"],
-            type=data["type"],
+            type=_intern(data["type"]),
             platform=data.get("platform"),
-            direction=data.get("direction"),
+            direction=_intern(data.get("direction")),
             parent_journal_entry_id=data.get("parent_journal_entry_id"),
-            performed_at=Identifier._parse_datetime(data.get("performed_at")),
+            performed_at=_parse_datetime(data.get("performed_at")),
         )
 
 
@@ -1824,20 +1865,18 @@ class JournalEntry:
 
         entry = cls(
             id=data["id"],
-            type=data.get("type", "unknown"),  # Backend may not always return type
+            type=_intern(data.get("type", "unknown")),  # Backend may not always return type
             description=data.get("description", ""),
             details=data.get("details"),
-            performed_at=Identifier._parse_datetime(
-                _get_value(data, "performed_at", "performedAt")
-            ),
-            created_at=Identifier._parse_datetime(_get_value(data, "created_at", "createdAt")),
-            updated_at=Identifier._parse_datetime(_get_value(data, "updated_at", "updatedAt")),
+            performed_at=_parse_datetime(_get_value(data, "performed_at", "performedAt")),
+            created_at=_parse_datetime(_get_value(data, "created_at", "createdAt")),
+            updated_at=_parse_datetime(_get_value(data, "updated_at", "updatedAt")),
             identifiers=identifiers,
             our_identifiers=our_identifiers,
             evidence=data.get("evidence"),
             case_id=_get_value(data, "case_id", "caseId"),
-            start_time=Identifier._parse_datetime(_get_value(data, "start_time", "startTime")),
-            end_time=Identifier._parse_datetime(_get_value(data, "end_time", "endTime")),
+            start_time=_parse_datetime(_get_value(data, "start_time", "startTime")),
+            end_time=_parse_datetime(_get_value(data, "end_time", "endTime")),
             parent_journal_entry_id=_get_value(
                 data, "parent_journal_entry_id", "parentJournalEntryId"
             ),
@@ -1852,7 +1891,7 @@ class JournalEntry:
             signature=data.get("signature"),
             signed_by=_get_value(data, "signed_by", "signedBy"),
             signature_algorithm=_get_value(data, "signature_algorithm", "signatureAlgorithm"),
-            signed_at=Identifier._parse_datetime(_get_value(data, "signed_at", "signedAt")),
+            signed_at=_parse_datetime(_get_value(data, "signed_at", "signedAt")),
             child_entries=child_entries,
         )
 
@@ -1958,8 +1997,8 @@ class Case:
             notes=data.get("notes"),
             status=data.get("status"),
             priority=data.get("priority"),
-            created_at=Identifier._parse_datetime(_get_value(data, "created_at", "createdAt")),
-            updated_at=Identifier._parse_datetime(_get_value(data, "updated_at", "updatedAt")),
+            created_at=_parse_datetime(_get_value(data, "created_at", "createdAt")),
+            updated_at=_parse_datetime(_get_value(data, "updated_at", "updatedAt")),
             created_by=_get_value(data, "created_by", "createdBy"),
             is_test=_get_value(data, "is_test", "isTest", False),
         )
@@ -2003,16 +2042,16 @@ class ExportStream:
         return cls(
             id=data["id"],
             name=data["name"],
-            data_type=_get_value(data, "data_type", "dataType", "journal_entry"),
-            identifier_types=_get_value(data, "identifier_types", "identifierTypes", []),
+            data_type=_intern(_get_value(data, "data_type", "dataType", "journal_entry")),
+            identifier_types=_get_value(data, "identifier_types", "identifierTypes") or [],
             min_confidence=_get_value(data, "min_confidence", "minConfidence", 0.0),
             max_confidence=_get_value(data, "max_confidence", "maxConfidence", 1.0),
             is_active=_get_value(data, "is_active", "isActive", True),
             consumer_key=_get_value(data, "consumer_key", "consumerKey"),
             retention_days=_get_value(data, "retention_days", "retentionDays", 30),
             filter_expression=_get_value(data, "filter_expression", "filterExpression"),
-            created_at=Identifier._parse_datetime(_get_value(data, "created_at", "createdAt")),
-            updated_at=Identifier._parse_datetime(_get_value(data, "updated_at", "updatedAt")),
+            created_at=_parse_datetime(_get_value(data, "created_at", "createdAt")),
+            updated_at=_parse_datetime(_get_value(data, "updated_at", "updatedAt")),
         )
 
 
@@ -2082,8 +2121,8 @@ class StreamEvidenceInfo:
             type=data.get("type", ""),
             description=data.get("description"),
             source=data.get("source"),
-            collected_at=Identifier._parse_datetime(data.get("collected_at")),
-            media_ids=data.get("media_ids", []),
+            collected_at=_parse_datetime(data.get("collected_at")),
+            media_ids=data.get("media_ids") or [],
             originator_id=data.get("originator_id"),
             originator_type=data.get("originator_type"),
         )
@@ -2122,7 +2161,7 @@ class StreamJournalEntryInfo:
             id=data.get("id", ""),
             type=data.get("type", ""),
             description=data.get("description", ""),
-            performed_at=Identifier._parse_datetime(data.get("performed_at")),
+            performed_at=_parse_datetime(data.get("performed_at")),
             originator_id=data.get("originator_id"),
             originator_type=data.get("originator_type"),
             evidence=evidence,
@@ -2253,11 +2292,11 @@ class IdentifierStreamMessage:
 
         return cls(
             identifier_id=data.get("identifier_id", ""),
-            type=data.get("type", ""),
+            type=_intern(data.get("type", "")),
             display_value=data.get("display_value", ""),
             details=data.get("details"),
             confidence=data.get("confidence", 0.0),
-            modified_at=Identifier._parse_datetime(data.get("modified_at")),
+            modified_at=_parse_datetime(data.get("modified_at")),
             cursor=data.get("cursor"),
             originator_id=data.get("originator_id"),
             tags=tags,
@@ -2330,14 +2369,14 @@ class JournalEntryStreamMessage:
 
         return cls(
             id=data.get("id", ""),
-            type=data.get("type", ""),
+            type=_intern(data.get("type", "")),
             description=data.get("description", ""),
             details=data.get("details"),
-            performed_at=Identifier._parse_datetime(data.get("performed_at")),
+            performed_at=_parse_datetime(data.get("performed_at")),
             confidence=data.get("confidence", 0.0),
             cursor=data.get("cursor"),
-            start_time=Identifier._parse_datetime(data.get("start_time")),
-            end_time=Identifier._parse_datetime(data.get("end_time")),
+            start_time=_parse_datetime(data.get("start_time")),
+            end_time=_parse_datetime(data.get("end_time")),
             parent_journal_entry_id=data.get("parent_journal_entry_id"),
             originator=originator,
             identifiers=identifiers,
@@ -2345,7 +2384,7 @@ class JournalEntryStreamMessage:
             is_test=data.get("is_test", False),
             locked_by=data.get("locked_by"),
             locked_by_name=data.get("locked_by_name"),
-            locked_at=Identifier._parse_datetime(data.get("locked_at")),
+            locked_at=_parse_datetime(data.get("locked_at")),
         )
 
 
@@ -2707,9 +2746,9 @@ class CaseComment:
     edited: bool = False
     deleted: bool = False
     parent_comment_id: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-    deleted_at: Optional[datetime] = None
+    created_at: Optional[datetime] = _LazyDatetime()
+    updated_at: Optional[datetime] = _LazyDatetime()
+    deleted_at: Optional[datetime] = _LazyDatetime()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CaseComment":
@@ -2724,9 +2763,9 @@ class CaseComment:
             edited=data.get("edited", False),
             deleted=data.get("deleted", False),
             parent_comment_id=data.get("parent_comment_id"),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
-            updated_at=Identifier._parse_datetime(data.get("updated_at")),
-            deleted_at=Identifier._parse_datetime(data.get("deleted_at")),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            deleted_at=data.get("deleted_at"),
         )
 
 
@@ -2770,8 +2809,8 @@ class Tag:
     flows_down_to_evidence: bool = True
     allocates_karma: Optional[int] = None
     owner_org_id: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    created_at: Optional[datetime] = _LazyDatetime()
+    updated_at: Optional[datetime] = _LazyDatetime()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Tag":
@@ -2779,10 +2818,10 @@ class Tag:
         return cls(
             id=data["id"],
             title=data["title"],
-            tag_type=data.get("tag_type", "valued"),
+            tag_type=_intern(data.get("tag_type", "valued")),
             description=data.get("description"),
-            aliases=data.get("aliases", []),
-            applicable_models=data.get("applicable_models", []),
+            aliases=data.get("aliases") or [],
+            applicable_models=data.get("applicable_models") or [],
             color=data.get("color"),
             icon=data.get("icon"),
             active=data.get("active", True),
@@ -2792,8 +2831,8 @@ class Tag:
             flows_down_to_evidence=data.get("flows_down_to_evidence", True),
             allocates_karma=data.get("allocates_karma"),
             owner_org_id=data.get("owner_org_id"),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
-            updated_at=Identifier._parse_datetime(data.get("updated_at")),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
         )
 
 
@@ -2819,8 +2858,8 @@ class TagValue:
     description: Optional[str] = None
     order: int = 0
     active: bool = True
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    created_at: Optional[datetime] = _LazyDatetime()
+    updated_at: Optional[datetime] = _LazyDatetime()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TagValue":
@@ -2832,8 +2871,8 @@ class TagValue:
             description=data.get("description"),
             order=data.get("order", 0),
             active=data.get("active", True),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
-            updated_at=Identifier._parse_datetime(data.get("updated_at")),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
         )
 
 
@@ -2871,8 +2910,8 @@ class Notification:
     severity: str = "info"
     entity_type: Optional[str] = None
     entity_id: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    created_at: Optional[datetime] = _LazyDatetime()
+    updated_at: Optional[datetime] = _LazyDatetime()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Notification":
@@ -2880,18 +2919,18 @@ class Notification:
         return cls(
             id=data["id"],
             user_id=data["user_id"],
-            timestamp=Identifier._parse_datetime(data["timestamp"]) or datetime.now(),
+            timestamp=_parse_datetime(data["timestamp"]) or datetime.now(),
             notification_text=data.get("notification_text", ""),
             service=data.get("service", ""),
             read=data.get("read", False),
             dismissed=data.get("dismissed", False),
             link=data.get("link"),
             icon=data.get("icon"),
-            severity=data.get("severity", "info"),
+            severity=_intern(data.get("severity", "info")),
             entity_type=data.get("entity_type"),
             entity_id=data.get("entity_id"),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
-            updated_at=Identifier._parse_datetime(data.get("updated_at")),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
         )
 
 
@@ -2923,10 +2962,10 @@ class Session:
     expires_at: datetime
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
-    revoked_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = _LazyDatetime()
     revoked_by: Optional[str] = None
     revoke_reason: Optional[str] = None
-    created_at: Optional[datetime] = None
+    created_at: Optional[datetime] = _LazyDatetime()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Session":
@@ -2935,15 +2974,15 @@ class Session:
             id=data["id"],
             jti=data["jti"],
             user_id=data["user_id"],
-            user_type=data.get("user_type", ""),
+            user_type=_intern(data.get("user_type", "")),
             clerk_user_id=data.get("clerk_user_id", ""),
-            expires_at=Identifier._parse_datetime(data["expires_at"]) or datetime.now(),
+            expires_at=_parse_datetime(data["expires_at"]) or datetime.now(),
             ip_address=data.get("ip_address"),
             user_agent=data.get("user_agent"),
-            revoked_at=Identifier._parse_datetime(data.get("revoked_at")),
+            revoked_at=data.get("revoked_at"),
             revoked_by=data.get("revoked_by"),
             revoke_reason=data.get("revoke_reason"),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
+            created_at=data.get("created_at"),
         )
 
 
@@ -2972,9 +3011,9 @@ class Passkey:
     transports: List[str] = field(default_factory=list)
     backup_eligible: bool = False
     backup_state: bool = False
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-    last_used_at: Optional[datetime] = None
+    created_at: Optional[datetime] = _LazyDatetime()
+    updated_at: Optional[datetime] = _LazyDatetime()
+    last_used_at: Optional[datetime] = _LazyDatetime()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Passkey":
@@ -2984,12 +3023,12 @@ class Passkey:
             user_id=data["user_id"],
             name=data.get("name", ""),
             sign_count=data.get("sign_count", 0),
-            transports=data.get("transports", []),
+            transports=data.get("transports") or [],
             backup_eligible=data.get("backup_eligible", False),
             backup_state=data.get("backup_state", False),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
-            updated_at=Identifier._parse_datetime(data.get("updated_at")),
-            last_used_at=Identifier._parse_datetime(data.get("last_used_at")),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            last_used_at=data.get("last_used_at"),
         )
 
 
@@ -3044,8 +3083,8 @@ class View:
             filter_criteria=data.get("filter_criteria"),
             sort_order=data.get("sort_order"),
             is_system=data.get("is_system", False),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
-            updated_at=Identifier._parse_datetime(data.get("updated_at")),
+            created_at=_parse_datetime(data.get("created_at")),
+            updated_at=_parse_datetime(data.get("updated_at")),
             created_by=data.get("created_by"),
             organization_id=data.get("organization_id"),
         )
@@ -3115,9 +3154,9 @@ class Report:
             journal_entry_count=data.get("journal_entry_count", 0),
             evidence_count=data.get("evidence_count", 0),
             download_url=data.get("download_url"),
-            generated_at=Identifier._parse_datetime(data.get("generated_at")),
-            expires_at=Identifier._parse_datetime(data.get("expires_at")),
-            created_at=Identifier._parse_datetime(data.get("created_at")),
+            generated_at=_parse_datetime(data.get("generated_at")),
+            expires_at=_parse_datetime(data.get("expires_at")),
+            created_at=_parse_datetime(data.get("created_at")),
             error_message=data.get("error_message"),
         )
 
@@ -4,6 +4,7 @@ These types provide a typed interface for SDK operations, similar to AWS CDK.
 """
 
 from dataclasses import dataclass, field, asdict
+from functools import singledispatch
 from typing import Any, Dict, List, Optional, Union
 
 
@@ -54,8 +55,49 @@ class StreamDataType:
     IDENTIFIER = "identifier"
 
 
+@singledispatch
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert an object to dictionary, handling both typed objects and dicts.
+
+    This allows the SDK to accept both typed objects and raw dictionaries for
+    backward compatibility and flexibility. Dicts and the SDK input types
+    (subclasses of ``_SDKInput``) dispatch directly on type; anything else
+    falls back to duck typing.
+    """
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    elif hasattr(obj, "__dict__"):
+        return {k: v for k, v in obj.__dict__.items() if v is not None}
+    else:
+        return obj
+
+
+@to_dict.register(dict)
+def _dict_to_dict(obj: Dict[str, Any]) -> Dict[str, Any]:
+    return obj
+
+
+def _typed_to_dict(obj: Any) -> Dict[str, Any]:
+    return obj.to_dict()
+
+
+class _SDKInput:
+    """Base for SDK input types; registers each subclass with :func:`to_dict` on creation."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        to_dict.register(cls, _typed_to_dict)
+
+
+def to_dict_list(items: Optional[List[Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Convert a list of objects to dictionaries."""
+    if items is None:
+        return None
+    return [to_dict(item) for item in items]
+
+
 @dataclass
-class TagLookup:
+class TagLookup(_SDKInput):
     """Tag lookup for applying tags to journal entries.
 
     Examples:
@@ -78,7 +120,7 @@ class TagLookup:
 
 
 @dataclass
-class FilterCriteria:
+class FilterCriteria(_SDKInput):
     """Unified filter criteria used across search, query, views, and export streams.
 
     All fields are optional. Only non-None fields are included in the API request.
@@ -200,15 +242,11 @@ class FilterCriteria:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API, only including non-None fields."""
-        result = {}
-        for k, v in self.__dict__.items():
-            if v is not None:
-                result[k] = v
-        return result
+        return {k: v for k, v in self.__dict__.items() if v is not None}
 
 
 @dataclass
-class StreamFilter:
+class StreamFilter(_SDKInput):
     """Filter configuration for export streams.
 
     .. deprecated::
@@ -248,7 +286,7 @@ class StreamFilter:
 
 
 @dataclass
-class ViewFilter:
+class ViewFilter(_SDKInput):
     """Filter criteria for saved views.
 
     .. deprecated::
@@ -293,7 +331,7 @@ class ViewFilter:
 
 
 @dataclass
-class ViewSortOrder:
+class ViewSortOrder(_SDKInput):
     """Sort order configuration for views.
 
     Examples:
@@ -314,26 +352,3 @@ FilterCriteriaInput = Union[FilterCriteria, Dict[str, Any]]
 StreamFilterInput = Union[StreamFilter, Dict[str, Any]]
 ViewFilterInput = Union[ViewFilter, FilterCriteria, Dict[str, Any]]
 ViewSortOrderInput = Union[ViewSortOrder, Dict[str, Any]]
-
-
-def to_dict(obj: Any) -> Dict[str, Any]:
-    """Convert an object to dictionary, handling both typed objects and dicts.
-
-    This allows the SDK to accept both typed objects and raw dictionaries for
-    backward compatibility and flexibility.
-    """
-    if isinstance(obj, dict):
-        return obj
-    elif hasattr(obj, "to_dict"):
-        return obj.to_dict()
-    elif hasattr(obj, "__dict__"):
-        return {k: v for k, v in obj.__dict__.items() if v is not None}
-    else:
-        return obj
-
-
-def to_dict_list(items: Optional[List[Any]]) -> Optional[List[Dict[str, Any]]]:
-    """Convert a list of objects to dictionaries."""
-    if items is None:
-        return None
-    return [to_dict(item) for item in items]
@@ -3,11 +3,12 @@ WebSocket client for real-time Scambus notifications and updates.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import random
 import time
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
 import websockets
@@ -17,8 +18,81 @@ from websockets.exceptions import ConnectionClosed, WebSocketException
 from .config import get_api_url, get_api_token
 from .models import Identifier, JournalEntry
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Registered callbacks for one channel/event: registration token -> (callback, is_coroutine)
+_HandlerMap = Dict[object, Tuple[Callable[[Any], Any], bool]]
+# Dispatch entry derived from a _HandlerMap: (callback, is_coroutine) in registration order
+_Dispatch = Tuple[Tuple[Callable[[Any], Any], bool], ...]
+
+# Heartbeat frames are recognised by prefix so they can be dropped without parsing.
+# This assumes the server's wire format: compact JSON with "type" as the first key.
+# Any other heartbeat encoding misses the fast path and is parsed like a normal
+# message; it has no channel, so no handlers run for it.
+_HEARTBEAT_PREFIX = '{"type":"heartbeat"'
+_HEARTBEAT_PREFIX_BYTES = _HEARTBEAT_PREFIX.encode("utf-8")
+
+# Frames are decoded to plain dicts and then converted with the models' from_dict.
+# Schema-typed decoding (e.g. msgspec Structs) would need a second copy of the
+# JournalEntry/Identifier field mappings and could not hand handlers the same
+# dataclass instances the HTTP client returns.
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _encode_subscribe(stream_id: str, cursor: str, include_test: bool) -> str:
+    """Encode (and cache) the subscribe control message for a stream."""
+    return _json_dumps(
+        {
+            "action": "subscribe",
+            "channel": f"stream:{stream_id}",
+            "cursor": cursor,
+            "include_test": include_test,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_unsubscribe(stream_id: str) -> str:
+    """Encode (and cache) the unsubscribe control message for a stream."""
+    return _json_dumps({"action": "unsubscribe", "channel": f"stream:{stream_id}"})
+
+
+@functools.lru_cache(maxsize=32)
+def _backoff_schedule(initial_delay: float, max_attempts: int) -> Tuple[float, ...]:
+    """
+    Compute (and cache) reconnect base delays: exponential backoff capped at 60 seconds.
+
+    The schedule stops at the first capped entry; later attempts reuse the last delay.
+
+    Args:
+        initial_delay: Delay before the first reconnection attempt
+        max_attempts: Maximum number of reconnection attempts
+
+    Returns:
+        Base delay per attempt, indexed by attempt number minus one
+    """
+    schedule = []
+    delay = initial_delay
+    while len(schedule) < max_attempts - 1 and delay < 60.0:
+        schedule.append(delay)
+        delay *= 2
+    schedule.append(min(delay, 60.0))
+    return tuple(schedule)
+
 
 class ScambusWebSocketClient:
     """
@@ -54,6 +128,12 @@ class ScambusWebSocketClient:
         ```
     """
 
+    # Close codes handled without backoff: 1012 = service restart, 1000 = normal closure
+    _CLOSE_CODE_ACTIONS = {1012: "restart", 1000: "stop"}
+
+    # Keys whose presence marks stream data as a JournalEntry
+    _JOURNAL_ENTRY_KEYS = frozenset(("identifiers", "description", "performed_at"))
+
     def __init__(
         self,
         api_url: Optional[str] = None,
@@ -62,6 +142,7 @@ class ScambusWebSocketClient:
         api_token: Optional[str] = None,
         max_reconnect_attempts: int = 10,
         reconnect_delay: float = 1.0,
+        compression: Optional[str] = None,
     ):
         """
         Initialize the WebSocket client.
@@ -73,6 +154,10 @@ class ScambusWebSocketClient:
             api_token: API JWT token (auto-loaded from CLI config if not provided)
             max_reconnect_attempts: Maximum number of reconnection attempts (default: 10)
             reconnect_delay: Initial delay between reconnection attempts in seconds (default: 1.0)
+            compression: WebSocket compression extension to negotiate, e.g. "deflate".
+                Disabled by default: per-message deflate costs CPU on every frame, which
+                outweighs the bandwidth saved for high-rate streams of small messages
+                (default: None)
         """
         # Load from CLI config if parameters not provided
         self.api_url = get_api_url(api_url)
@@ -81,9 +166,18 @@ class ScambusWebSocketClient:
         self.max_reconnect_attempts = max_reconnect_attempts
         self.reconnect_delay = reconnect_delay
         self.reconnect_attempts = 0
+        self.compression = compression
         self._ws: Optional[WebSocketClientProtocol] = None
         self._running = False
-        self._message_handlers: Dict[str, Dict[str, list]] = {}  # channel -> event -> [callbacks]
+        # (channel, event) -> {registration token: (callback, is_coroutine_function)}
+        self._handlers: Dict[Tuple[str, str], _HandlerMap] = {}
+        # channel -> {registration token: (callback, is_coroutine_function)} for event "*"
+        self._wildcard_handlers: Dict[str, _HandlerMap] = {}
+        # Flat dispatch tables rebuilt from the registrations above whenever they change
+        self._dispatch: Dict[Tuple[str, str], _Dispatch] = {}
+        self._wildcard_dispatch: Dict[str, _Dispatch] = {}
+        # Channels whose data is converted to typed models, classified in on()
+        self._stream_channels: Set[str] = set()
 
         # Build WebSocket URL (convert http(s):// to ws(s)://)
         # For production (scambus.net), use live.scambus.net subdomain for direct ALB access
@@ -106,20 +200,22 @@ class ScambusWebSocketClient:
         else:
             raise ValueError("Either api_key_id/api_key_secret or api_token must be provided")
 
+        # Handshake headers are built once and reused by every (re)connect
+        # (renamed from extra_headers in websockets 14.0+)
+        self._additional_headers = {
+            self.auth_header[0]: self.auth_header[1],
+            "User-Agent": "scambus-python-client/2.0.0",
+        }
+
     async def connect(self) -> None:
         """Establish WebSocket connection with authentication."""
         try:
-            # Create additional headers for authentication (renamed from extra_headers in websockets 14.0+)
-            additional_headers = {
-                self.auth_header[0]: self.auth_header[1],
-                "User-Agent": "scambus-python-client/2.0.0",
-            }
-
             logger.info(f"Connecting to WebSocket: {self.ws_url}")
-            logger.debug(f"WebSocket headers: {additional_headers}")
+            logger.debug("WebSocket headers: %s", self._additional_headers)
             self._ws = await websockets.connect(
                 self.ws_url,
-                additional_headers=additional_headers,
+                additional_headers=self._additional_headers,
+                compression=self.compression,
                 ping_interval=30,  # Send ping every 30 seconds
                 ping_timeout=10,  # Wait 10 seconds for pong
                 close_timeout=10,
@@ -146,17 +242,15 @@ class ScambusWebSocketClient:
         """
         Convert stream message data to typed object.
 
+        Only called for stream channels; ``on()`` records which channels those are.
+
         Args:
             data: Raw message data dictionary
-            channel: Channel name (e.g., "stream:abc-123")
+            channel: Stream channel name (e.g., "stream:abc-123")
 
         Returns:
-            Typed JournalEntry or Identifier object, or original dict if not a stream message
+            Typed JournalEntry or Identifier object, or original dict if the shape is unknown
         """
-        # Only convert data from stream channels
-        if not channel.startswith("stream:"):
-            return data
-
         if not data or not isinstance(data, dict):
             return data
 
@@ -164,12 +258,10 @@ class ScambusWebSocketClient:
             # Detect data type based on fields present
             # JournalEntry has 'identifiers', 'description', 'performed_at'
             # Identifier has 'display_value', 'confidence' structure
-            if "display_value" in data or (
-                "confidence" in data and isinstance(data.get("confidence"), dict)
-            ):
+            if "display_value" in data or isinstance(data.get("confidence"), dict):
                 # This is an Identifier
                 return Identifier.from_dict(data)
-            elif "identifiers" in data or "description" in data or "performed_at" in data:
+            elif not data.keys().isdisjoint(self._JOURNAL_ENTRY_KEYS):
                 # This is a JournalEntry
                 return JournalEntry.from_dict(data)
             else:
@@ -182,15 +274,21 @@ class ScambusWebSocketClient:
             logger.error(f"Error converting stream data to typed object: {e}", exc_info=True)
             return data
 
-    async def _handle_message(self, message_data: str) -> None:
+    async def _handle_message(self, message_data: Union[str, bytes]) -> None:
         """
         Handle incoming WebSocket message.
 
         Args:
-            message_data: Raw JSON message string
+            message_data: Raw JSON message (text frame as str, binary frame as bytes)
         """
+        if isinstance(message_data, str):
+            if message_data.startswith(_HEARTBEAT_PREFIX):
+                return
+        elif message_data.startswith(_HEARTBEAT_PREFIX_BYTES):
+            return
+
         try:
-            message = json.loads(message_data)
+            message = _json_loads(message_data)
 
             # Extract message fields
             msg_type = message.get("type")
@@ -199,8 +297,8 @@ class ScambusWebSocketClient:
             data = message.get("data")
 
             # Log non-heartbeat messages
-            if msg_type != "heartbeat":
-                logger.debug(f"Received {msg_type}/{event} on channel {channel}")
+            if msg_type != "heartbeat" and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received %s/%s on channel %s", msg_type, event, channel)
 
             # Special handling for connection confirmation
             if msg_type == "connected":
@@ -208,44 +306,65 @@ class ScambusWebSocketClient:
                 return
 
             # Call registered handlers for this channel/event
-            if channel in self._message_handlers:
-                channel_handlers = self._message_handlers[channel]
-
-                # Convert stream data to typed objects for event-specific handlers
-                typed_data = self._convert_stream_data(data, channel) if data else data
-
-                # Call event-specific handlers
-                if event in channel_handlers:
-                    for handler in channel_handlers[event]:
-                        try:
-                            if asyncio.iscoroutinefunction(handler):
-                                await handler(typed_data)
-                            else:
-                                handler(typed_data)
-                        except Exception as e:
-                            logger.error(f"Error in message handler: {e}", exc_info=True)
-
-                # Call wildcard handlers (event = '*')
-                # Wildcard handlers receive the full message (not converted)
-                if "*" in channel_handlers:
-                    for handler in channel_handlers["*"]:
-                        try:
-                            if asyncio.iscoroutinefunction(handler):
-                                await handler(message)
-                            else:
-                                handler(message)
-                        except Exception as e:
-                            logger.error(f"Error in wildcard handler: {e}", exc_info=True)
+            handlers = self._dispatch.get((channel, event))
+            wildcard_handlers = self._wildcard_dispatch.get(channel)
+
+            # Call event-specific handlers with stream data converted to typed objects
+            if handlers:
+                if data and channel in self._stream_channels:
+                    typed_data = self._convert_stream_data(data, channel)
+                else:
+                    typed_data = data
+                await self._call_handlers(handlers, typed_data, "message")
+
+            # Call wildcard handlers (event = '*')
+            # Wildcard handlers receive the full message (not converted)
+            if wildcard_handlers:
+                await self._call_handlers(wildcard_handlers, message, "wildcard")
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse WebSocket message: {e}")
         except Exception as e:
             logger.error(f"Error handling WebSocket message: {e}", exc_info=True)
 
+    @staticmethod
+    def _build_dispatch(handlers: _HandlerMap) -> _Dispatch:
+        """Snapshot registered handlers as a tuple in registration order."""
+        return tuple(handlers.values())
+
+    @staticmethod
+    async def _call_handlers(handlers: _Dispatch, payload: Any, kind: str) -> None:
+        """
+        Invoke handlers one after another in registration order.
+
+        Async handlers are awaited before the next handler runs. Exceptions are
+        logged and do not stop later handlers; BaseExceptions such as
+        ``asyncio.CancelledError`` propagate.
+
+        Args:
+            handlers: Dispatch entry of (callback, is_coroutine) pairs
+            payload: Value passed to each callback
+            kind: Handler kind used in error logs ("message" or "wildcard")
+        """
+        # The tuple is replaced, never mutated, so a handler may unsubscribe
+        # itself mid-dispatch without affecting this iteration
+        for handler, is_coro in handlers:
+            try:
+                if is_coro:
+                    await handler(payload)
+                else:
+                    handler(payload)
+            except Exception as e:
+                logger.error(f"Error in {kind} handler: {e}", exc_info=True)
+
     def on(self, channel: str, event: str, callback: Callable[[Any], None]) -> Callable[[], None]:
         """
         Register a callback for specific channel and event.
 
+        For each message, handlers for the exact event run first and wildcard
+        handlers after them, each group in registration order. Async handlers are
+        awaited before the next handler is called.
+
         Args:
             channel: Channel name (e.g., "notifications", "stats")
             event: Event type (e.g., "notification", "update") or "*" for all events
@@ -266,26 +385,33 @@ class ScambusWebSocketClient:
             unsubscribe()
             ```
         """
-        if channel not in self._message_handlers:
-            self._message_handlers[channel] = {}
+        if channel.startswith("stream:"):
+            self._stream_channels.add(channel)
 
-        if event not in self._message_handlers[channel]:
-            self._message_handlers[channel][event] = []
+        # Wildcard handlers are kept apart so dispatch is one lookup per table
+        if event == "*":
+            table, dispatch, key = self._wildcard_handlers, self._wildcard_dispatch, channel
+        else:
+            table, dispatch, key = self._handlers, self._dispatch, (channel, event)
 
-        self._message_handlers[channel][event].append(callback)
+        # Classify once here rather than on every dispatched message. Each registration
+        # gets its own token, so unsubscribing is a dict pop rather than a list scan and
+        # registering the same callback twice still calls it twice.
+        token = object()
+        handlers = table.setdefault(key, {})
+        handlers[token] = (callback, asyncio.iscoroutinefunction(callback))
+        dispatch[key] = self._build_dispatch(handlers)
 
         # Return unsubscribe function
         def unsubscribe():
-            if (
-                channel in self._message_handlers
-                and event in self._message_handlers[channel]
-                and callback in self._message_handlers[channel][event]
-            ):
-                self._message_handlers[channel][event].remove(callback)
-                if not self._message_handlers[channel][event]:
-                    del self._message_handlers[channel][event]
-                if not self._message_handlers[channel]:
-                    del self._message_handlers[channel]
+            handlers = table.get(key)
+            if not handlers or handlers.pop(token, None) is None:
+                return
+            if handlers:
+                dispatch[key] = self._build_dispatch(handlers)
+            else:
+                del table[key]
+                del dispatch[key]
 
         return unsubscribe
 
@@ -305,11 +431,11 @@ class ScambusWebSocketClient:
             return False
 
         # Exponential backoff with jitter to prevent thundering herd
-        # Calculate base delay with exponential backoff, capped at 60 seconds
-        base_delay = min(self.reconnect_delay * (2 ** (self.reconnect_attempts - 1)), 60.0)
+        # Base delay comes from the cached schedule for the current settings, capped at 60 seconds
+        schedule = _backoff_schedule(self.reconnect_delay, self.max_reconnect_attempts)
+        base_delay = schedule[min(self.reconnect_attempts, len(schedule)) - 1]
         # Add jitter: random value between 0 and 25% of base delay
-        jitter = random.uniform(0, base_delay * 0.25)
-        delay = base_delay + jitter
+        delay = base_delay + random.random() * base_delay * 0.25
 
         logger.info(
             f"Reconnecting in {delay:.1f}s (attempt {self.reconnect_attempts}/{self.max_reconnect_attempts})"
@@ -347,41 +473,59 @@ class ScambusWebSocketClient:
                     await self.connect()
 
                 # Listen for messages
+                # Both parsers accept str and bytes, so binary frames are not decoded first
                 async for message in self._ws:
-                    if isinstance(message, str):
-                        await self._handle_message(message)
-                    elif isinstance(message, bytes):
-                        await self._handle_message(message.decode("utf-8"))
+                    await self._handle_message(message)
 
-            except ConnectionClosed as e:
-                if e.code == 1012:
+            except Exception as e:
+                # Close codes with a fixed outcome; anything else is retried with backoff
+                closed = isinstance(e, ConnectionClosed)
+                action = self._CLOSE_CODE_ACTIONS.get(e.code) if closed else None
+                if action == "restart":
                     # Service restart - reconnect immediately
                     logger.info("Server restarting - reconnecting immediately")
                     self.reconnect_attempts = 0  # Reset attempts for service restart
                     await asyncio.sleep(0.1)  # Brief delay
                     continue
-                elif e.code == 1000:
+                if action == "stop":
                     # Normal closure
                     logger.info("WebSocket closed normally")
                     break
-                else:
+
+                if closed:
                     logger.warning(f"WebSocket connection closed: code={e.code} reason={e.reason}")
+                elif isinstance(e, WebSocketException):
+                    logger.error(f"WebSocket error: {e}")
+                else:
+                    logger.error(f"Unexpected error in WebSocket client: {e}", exc_info=True)
 
-                # Attempt reconnection for abnormal closures
                 if not await self._reconnect():
                     break
 
-            except WebSocketException as e:
-                logger.error(f"WebSocket error: {e}")
-                if not await self._reconnect():
-                    break
+        logger.info("WebSocket client stopped")
 
-            except Exception as e:
-                logger.error(f"Unexpected error in WebSocket client: {e}", exc_info=True)
-                if not await self._reconnect():
-                    break
+    async def _run_reporting_errors(
+        self, on_error: Optional[Callable[[Exception], Any]] = None
+    ) -> None:
+        """
+        Run the client, passing an escaping exception to ``on_error`` if given.
 
-        logger.info("WebSocket client stopped")
+        Args:
+            on_error: Optional callback for errors (can be sync or async)
+        """
+        if on_error is None:
+            await self.run()
+            return
+
+        # Classified before running; the callback fires at most once per run
+        is_coro = asyncio.iscoroutinefunction(on_error)
+        try:
+            await self.run()
+        except Exception as e:
+            if is_coro:
+                await on_error(e)
+            else:
+                on_error(e)
 
     async def listen_notifications(
         self,
@@ -412,21 +556,7 @@ class ScambusWebSocketClient:
         # Register notification handler
         self.on("notifications", "notification", on_notification)
 
-        # Register error handler if provided
-        if on_error:
-
-            async def error_wrapper():
-                try:
-                    await self.run()
-                except Exception as e:
-                    if asyncio.iscoroutinefunction(on_error):
-                        await on_error(e)
-                    else:
-                        on_error(e)
-
-            await error_wrapper()
-        else:
-            await self.run()
+        await self._run_reporting_errors(on_error)
 
     async def subscribe_stream(
         self, stream_id: str, cursor: str = "$", include_test: bool = False
@@ -467,18 +597,56 @@ class ScambusWebSocketClient:
 
         # Send subscribe message to server with cursor
         # Always send include_test to ensure server state is updated
-        subscribe_msg = {
-            "action": "subscribe",
-            "channel": f"stream:{stream_id}",
-            "cursor": cursor,
-            "include_test": include_test,
-        }
-
-        await self._ws.send(json.dumps(subscribe_msg))
+        await self._ws.send(_encode_subscribe(stream_id, cursor, include_test))
         logger.info(
             f"Sent subscribe request for stream: {stream_id} (cursor: {cursor}, include_test: {include_test})"
         )
 
+    async def subscribe_streams(
+        self,
+        streams: Union[Mapping[str, str], Iterable[Tuple[str, str]]],
+        include_test: bool = False,
+    ) -> None:
+        """
+        Subscribe to several export streams at once, each from its own cursor.
+
+        The subscribe messages are encoded up front and written back-to-back, so
+        subscribing to many streams at startup does not interleave encoding and
+        logging with each send.
+
+        Args:
+            streams: Mapping of stream UUID to starting cursor, or an iterable of
+                (stream_id, cursor) pairs. Cursors take the same values as
+                subscribe_stream's cursor ("$", "0-0" or a message ID).
+            include_test: If True, also receive test data (is_test=true entries)
+
+        Raises:
+            TypeError: If streams is a string rather than a mapping or pairs
+            RuntimeError: If not connected
+
+        Example:
+            ```python
+            await ws_client.subscribe_streams({"abc-123": "0-0", "def-456": "$"})
+            ```
+        """
+        if isinstance(streams, (str, bytes)):
+            raise TypeError(
+                "streams must be a mapping or (stream_id, cursor) pairs, not a string; "
+                "use subscribe_stream() for a single stream"
+            )
+        if not self._ws or self._ws.closed:
+            raise RuntimeError("WebSocket not connected. Call connect() first.")
+
+        pairs = streams.items() if isinstance(streams, Mapping) else streams
+        messages = [
+            _encode_subscribe(stream_id, cursor, include_test) for stream_id, cursor in pairs
+        ]
+        for message in messages:
+            await self._ws.send(message)
+        logger.info(
+            f"Sent subscribe requests for {len(messages)} streams (include_test: {include_test})"
+        )
+
     async def unsubscribe_stream(self, stream_id: str) -> None:
         """
         Unsubscribe from an export stream.
@@ -495,9 +663,7 @@ class ScambusWebSocketClient:
             raise RuntimeError("WebSocket not connected. Call connect() first.")
 
         # Send unsubscribe message to server
-        unsubscribe_msg = {"action": "unsubscribe", "channel": f"stream:{stream_id}"}
-
-        await self._ws.send(json.dumps(unsubscribe_msg))
+        await self._ws.send(_encode_unsubscribe(stream_id))
         logger.info(f"Sent unsubscribe request for stream: {stream_id}")
 
     async def listen_stream(
@@ -560,18 +726,4 @@ class ScambusWebSocketClient:
         # Subscribe to stream with cursor and test data option
         await self.subscribe_stream(stream_id, cursor=cursor, include_test=include_test)
 
-        # Register error handler if provided
-        if on_error:
-
-            async def error_wrapper():
-                try:
-                    await self.run()
-                except Exception as e:
-                    if asyncio.iscoroutinefunction(on_error):
-                        await on_error(e)
-                    else:
-                        on_error(e)
-
-            await error_wrapper()
-        else:
-            await self.run()
+        await self._run_reporting_errors(on_error)
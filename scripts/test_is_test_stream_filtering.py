@@ -4,61 +4,80 @@ One-off script to verify is_test filtering on export streams.
 
 This script:
 1. Creates a temporary export stream filtering for phone numbers with is_test=True
-2. Listens in the background
+2. Listens in the background over WebSocket
 3. Creates two journal entries (one matching, one not)
 4. Verifies only the matching entry arrives
 
 Run with: python scripts/test_is_test_stream_filtering.py
 """
 
+import asyncio
 import sys
-import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from typing import Any, Dict, List
+from typing import Any, List
 
 from scambus_client import ScambusClient
 
 
-def poll_stream_for_events(
+async def _listen_for_events(
     client: ScambusClient,
     stream_id: str,
     expected_count: int,
-    timeout_seconds: float = 30.0,
-    poll_interval: float = 1.0,
-) -> List[Dict[str, Any]]:
-    """Poll a stream until we receive the expected number of events or timeout."""
-    all_events = []
-    cursor = "0"
-    start_time = time.time()
-
-    while time.time() - start_time < timeout_seconds:
-        try:
-            result = client.consume_stream(
-                stream_id=stream_id,
-                cursor=cursor,
-                order="asc",
-                limit=100,
-                timeout=5.0,
-            )
-
-            events = result.get("events", []) or result.get("messages", [])
-            if events:
-                all_events.extend(events)
-                cursor = result.get("cursor") or result.get("nextCursor")
-
-            if len(all_events) >= expected_count:
-                break
+    timeout_seconds: float,
+    subscribed: asyncio.Event,
+) -> List[Any]:
+    """Collect pushed stream messages until enough arrive or the timeout expires.
+
+    ``subscribed`` is set once the connection is open and the stream subscribed.
+    """
+    ws_client = client.create_websocket_client()
+    all_events: List[Any] = []
+    done = asyncio.Event()
+
+    def on_message(message: Any) -> None:
+        all_events.append(message)
+        if len(all_events) >= expected_count:
+            done.set()
+
+    ws_client.on(f"stream:{stream_id}", "message", on_message)
+    await ws_client.connect()
+    # The stream filters for is_test entries, so test data must be requested explicitly
+    await ws_client.subscribe_stream(stream_id, cursor="0-0", include_test=True)
+    subscribed.set()
+
+    run_task = asyncio.ensure_future(ws_client.run())
+    try:
+        await asyncio.wait_for(done.wait(), timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        await ws_client.disconnect()
+        await run_task
 
-        except Exception as e:
-            print(f"Error polling stream: {e}")
+    return all_events
 
-        time.sleep(poll_interval)
 
-    return all_events
+async def poll_stream_for_events(
+    client: ScambusClient,
+    stream_id: str,
+    expected_count: int,
+    subscribed: asyncio.Event,
+    timeout_seconds: float = 30.0,
+) -> List[Any]:
+    """Listen on a stream over WebSocket until we receive the expected number of events."""
+    try:
+        return await _listen_for_events(
+            client, stream_id, expected_count, timeout_seconds, subscribed
+        )
+    except Exception as e:
+        print(f"Error listening to stream: {e}")
+        return []
+    finally:
+        # Never leave main() waiting on a listener that failed before subscribing
+        subscribed.set()
 
 
-def main():
+async def main():
     """Main test function."""
     print("=" * 60)
     print("Test: is_test filtering on export streams")
@@ -85,7 +104,10 @@ def main():
 
         filter_expr = "$.is_test == true"
 
-        stream = client.create_temporary_stream(
+        # The client is blocking, so its calls run in a worker thread to keep the
+        # event loop (and the WebSocket listener) responsive
+        stream = await asyncio.to_thread(
+            client.create_temporary_stream,
             data_type="journal_entry",
             identifier_types="phone",
             filter_expression=filter_expr,
@@ -95,56 +117,56 @@ def main():
         print(f"   Filter expression: {stream.filter_expression}")
 
         # Give the stream a moment to be ready
-        time.sleep(2)
+        await asyncio.sleep(2)
 
-        # Start polling in background thread
+        # Start listening in a background task
         print("\n3. Starting background stream listener...")
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            poll_future = executor.submit(
-                poll_stream_for_events,
-                client,
-                stream.id,
-                expected_count=1,
-                timeout_seconds=30.0,
-                poll_interval=1.0,
+        subscribed = asyncio.Event()
+        listen_task = asyncio.create_task(
+            poll_stream_for_events(
+                client, stream.id, expected_count=1, subscribed=subscribed, timeout_seconds=30.0
             )
+        )
 
-            time.sleep(1)
-
-            # Create test journal entry (is_test=True) - SHOULD match
-            print("\n4. Creating journal entries...")
-            print(f"   Creating TEST entry with phone: {test_phone} (is_test=True)")
-            test_entry = client.create_journal_entry(
-                entry_type="phone_call",
-                description=f"Test entry for stream filter test {test_run_id}",
-                details={"direction": "inbound", "platform": "pstn"},
-                identifier_lookups=[{"type": "phone", "value": test_phone, "confidence": 0.9}],
-                is_test=True,
-            )
-            test_entry_id = test_entry.id
-            print(f"   Test entry created: {test_entry_id}")
-            print(f"   Entry is_test flag: {test_entry.is_test}")
-
-            # Create non-test journal entry (is_test=False) - should NOT match
-            print(f"\n   Creating NON-TEST entry with phone: {non_test_phone} (is_test=False)")
-            non_test_entry = client.create_journal_entry(
-                entry_type="phone_call",
-                description=f"Non-test entry for stream filter test {test_run_id}",
-                details={"direction": "outbound", "platform": "pstn"},
-                identifier_lookups=[{"type": "phone", "value": non_test_phone, "confidence": 0.9}],
-                is_test=False,
-            )
-            non_test_entry_id = non_test_entry.id
-            print(f"   Non-test entry created: {non_test_entry_id}")
-            print(f"   Entry is_test flag: {non_test_entry.is_test}")
-
-            # Wait for polling to complete
-            print("\n5. Waiting for stream events...")
-            try:
-                events = poll_future.result(timeout=35.0)
-            except FuturesTimeoutError:
-                events = []
-                print("   WARNING: Polling timed out")
+        # Wait until the listener has connected and subscribed
+        await subscribed.wait()
+
+        # Create test journal entry (is_test=True) - SHOULD match
+        print("\n4. Creating journal entries...")
+        print(f"   Creating TEST entry with phone: {test_phone} (is_test=True)")
+        test_entry = await asyncio.to_thread(
+            client.create_journal_entry,
+            entry_type="phone_call",
+            description=f"Test entry for stream filter test {test_run_id}",
+            details={"direction": "inbound", "platform": "pstn"},
+            identifier_lookups=[{"type": "phone", "value": test_phone, "confidence": 0.9}],
+            is_test=True,
+        )
+        test_entry_id = test_entry.id
+        print(f"   Test entry created: {test_entry_id}")
+        print(f"   Entry is_test flag: {test_entry.is_test}")
+
+        # Create non-test journal entry (is_test=False) - should NOT match
+        print(f"\n   Creating NON-TEST entry with phone: {non_test_phone} (is_test=False)")
+        non_test_entry = await asyncio.to_thread(
+            client.create_journal_entry,
+            entry_type="phone_call",
+            description=f"Non-test entry for stream filter test {test_run_id}",
+            details={"direction": "outbound", "platform": "pstn"},
+            identifier_lookups=[{"type": "phone", "value": non_test_phone, "confidence": 0.9}],
+            is_test=False,
+        )
+        non_test_entry_id = non_test_entry.id
+        print(f"   Non-test entry created: {non_test_entry_id}")
+        print(f"   Entry is_test flag: {non_test_entry.is_test}")
+
+        # Wait for the listener to finish
+        print("\n5. Waiting for stream events...")
+        try:
+            events = await asyncio.wait_for(listen_task, timeout=35.0)
+        except asyncio.TimeoutError:
+            events = []
+            print("   WARNING: Listening timed out")
 
         # Analyze results
         print("\n6. Analyzing results...")
@@ -152,12 +174,13 @@ def main():
 
         received_entry_ids = set()
         for event in events:
-            event_id = event.get("id") or event.get("journal_entry_id")
+            # Stream messages arrive as typed JournalEntry objects
+            event_id = getattr(event, "id", None)
             if event_id:
                 received_entry_ids.add(event_id)
             print(f"   - Event: {event_id}")
-            if "is_test" in event:
-                print(f"     is_test: {event.get('is_test')}")
+            if hasattr(event, "is_test"):
+                print(f"     is_test: {event.is_test}")
 
         # Verify results
         print("\n7. Verification...")
@@ -202,26 +225,26 @@ def main():
         print("\n8. Cleanup...")
         try:
             if stream:
-                client.delete_stream(stream.id)
+                await asyncio.to_thread(client.delete_stream, stream.id)
                 print(f"   Deleted stream: {stream.id}")
         except Exception as e:
             print(f"   Warning: Could not delete stream: {e}")
 
         try:
             if test_entry_id:
-                client.delete_journal_entry(test_entry_id)
+                await asyncio.to_thread(client.delete_journal_entry, test_entry_id)
                 print(f"   Deleted test entry: {test_entry_id}")
         except Exception as e:
             print(f"   Warning: Could not delete test entry: {e}")
 
         try:
             if non_test_entry_id:
-                client.delete_journal_entry(non_test_entry_id)
+                await asyncio.to_thread(client.delete_journal_entry, non_test_entry_id)
                 print(f"   Deleted non-test entry: {non_test_entry_id}")
         except Exception as e:
             print(f"   Warning: Could not delete non-test entry: {e}")
 
 
 if __name__ == "__main__":
-    success = main()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
@@ -4,51 +4,91 @@ Test script for identifier type filter helpers.
 """
 
 from scambus_client import (
+    InvalidConfidenceError,
+    InvalidIdentifierTypeError,
     build_identifier_type_filter,
     build_combined_filter,
 )
 
+# (label, args, kwargs, expected expression)
+IDENTIFIER_TYPE_FILTER_CASES = [
+    (
+        "Single type (identifier)",
+        ("phone",),
+        {"data_type": "identifier"},
+        '$.type == "phone"',
+    ),
+    (
+        "Multiple types (identifier)",
+        (["phone", "email"],),
+        {"data_type": "identifier"},
+        '$.type == "phone" || $.type == "email"',
+    ),
+    (
+        "Single type (journal_entry)",
+        ("phone",),
+        {"data_type": "journal_entry"},
+        'exists($.identifiers[*] ? (@.type == "phone"))',
+    ),
+    (
+        "Multiple types (journal_entry)",
+        (["phone", "email"],),
+        {"data_type": "journal_entry"},
+        'exists($.identifiers[*] ? (@.type == "phone" || @.type == "email"))',
+    ),
+    (
+        "Three types (default)",
+        (["phone", "email", "url"],),
+        {},
+        '$.type == "phone" || $.type == "email" || $.type == "url"',
+    ),
+]
+
+# (label, kwargs, expected expression or None)
+COMBINED_FILTER_CASES = [
+    ("Identifier type only", {"identifier_types": "phone"}, '$.type == "phone"'),
+    (
+        "Type + min confidence",
+        {"identifier_types": "phone", "min_confidence": 0.8},
+        '$.type == "phone" && $.confidence >= 0.8',
+    ),
+    (
+        "Multiple types + confidence range",
+        {"identifier_types": ["phone", "email"], "min_confidence": 0.9, "max_confidence": 1.0},
+        '($.type == "phone" || $.type == "email") && $.confidence >= 0.9 && $.confidence <= 1.0',
+    ),
+    (
+        "Custom expression only",
+        {"custom_expression": '$.details.platform == "whatsapp"'},
+        '$.details.platform == "whatsapp"',
+    ),
+    (
+        "All options combined",
+        {
+            "identifier_types": "social_media",
+            "min_confidence": 0.85,
+            "custom_expression": '$.details.platform == "telegram"',
+        },
+        '$.type == "social_media" && $.confidence >= 0.85 && $.details.platform == "telegram"',
+    ),
+    ("No parameters returns None", {}, None),
+]
+
 
 def test_build_identifier_type_filter():
     """Test building identifier type filters."""
     print("Testing build_identifier_type_filter()...")
 
-    # Test single type for identifier streams
-    result = build_identifier_type_filter("phone", data_type="identifier")
-    expected = '$.type == "phone"'
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Single type (identifier): {result}")
-
-    # Test multiple types for identifier streams
-    result = build_identifier_type_filter(["phone", "email"], data_type="identifier")
-    expected = '$.type == "phone" || $.type == "email"'
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Multiple types (identifier): {result}")
-
-    # Test single type for journal entry streams
-    result = build_identifier_type_filter("phone", data_type="journal_entry")
-    expected = 'exists($.identifiers[*] ? (@.type == "phone"))'
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Single type (journal_entry): {result}")
-
-    # Test multiple types for journal entry streams
-    result = build_identifier_type_filter(["phone", "email"], data_type="journal_entry")
-    expected = 'exists($.identifiers[*] ? (@.type == "phone" || @.type == "email"))'
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Multiple types (journal_entry): {result}")
-
-    # Test three types
-    result = build_identifier_type_filter(["phone", "email", "url"])
-    expected = '$.type == "phone" || $.type == "email" || $.type == "url"'
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Three types (default): {result}")
+    for label, args, kwargs, expected in IDENTIFIER_TYPE_FILTER_CASES:
+        result = build_identifier_type_filter(*args, **kwargs)
+        assert result == expected, f"{label} - Expected: {expected}, Got: {result}"
+        print(f"  ✓ {label}: {result}")
 
     # Test invalid type
     try:
         build_identifier_type_filter("invalid_type")
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Invalid identifier type" in str(e)
+        assert False, "Should have raised InvalidIdentifierTypeError"
+    except InvalidIdentifierTypeError as e:
         print(f"  ✓ Invalid type rejected: {e}")
 
     print("  All build_identifier_type_filter() tests passed!\n")
@@ -58,57 +98,16 @@ def test_build_combined_filter():
     """Test building combined filters."""
     print("Testing build_combined_filter()...")
 
-    # Test identifier types only
-    result = build_combined_filter(identifier_types="phone")
-    expected = '$.type == "phone"'
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Identifier type only: {result}")
-
-    # Test identifier types with confidence
-    result = build_combined_filter(identifier_types="phone", min_confidence=0.8)
-    expected = '$.type == "phone" && $.confidence >= 0.8'
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Type + min confidence: {result}")
-
-    # Test multiple types with confidence range
-    result = build_combined_filter(
-        identifier_types=["phone", "email"], min_confidence=0.9, max_confidence=1.0
-    )
-    expected = (
-        '($.type == "phone" || $.type == "email") && $.confidence >= 0.9 && $.confidence <= 1.0'
-    )
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Multiple types + confidence range: {result}")
-
-    # Test custom expression only
-    result = build_combined_filter(custom_expression='$.details.platform == "whatsapp"')
-    expected = '$.details.platform == "whatsapp"'
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ Custom expression only: {result}")
-
-    # Test everything combined
-    result = build_combined_filter(
-        identifier_types="social_media",
-        min_confidence=0.85,
-        custom_expression='$.details.platform == "telegram"',
-    )
-    expected = (
-        '$.type == "social_media" && $.confidence >= 0.85 && $.details.platform == "telegram"'
-    )
-    assert result == expected, f"Expected: {expected}, Got: {result}"
-    print(f"  ✓ All options combined: {result}")
-
-    # Test no parameters (should return None)
-    result = build_combined_filter()
-    assert result is None, f"Expected None, Got: {result}"
-    print(f"  ✓ No parameters returns None")
+    for label, kwargs, expected in COMBINED_FILTER_CASES:
+        result = build_combined_filter(**kwargs)
+        assert result == expected, f"{label} - Expected: {expected}, Got: {result}"
+        print(f"  ✓ {label}: {result}")
 
     # Test invalid confidence range
     try:
         build_combined_filter(min_confidence=1.5)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "must be between 0 and 1" in str(e)
+        assert False, "Should have raised InvalidConfidenceError"
+    except InvalidConfidenceError as e:
         print(f"  ✓ Invalid confidence rejected: {e}")
 
     print("  All build_combined_filter() tests passed!\n")
@@ -3,80 +3,92 @@
 Test creating streams using the identifier_types helper.
 """
 
+import functools
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 from scambus_client import ScambusClient
 
+_CONFIG_PATH = os.path.expanduser("~/.scambus/config.json")
+
+
+@functools.lru_cache(maxsize=1)
+def _read_token(config_path: str, mtime: float) -> Optional[str]:
+    """Parse the auth token from the CLI config (cached until the file's mtime changes)."""
+    with open(config_path, "rb") as f:
+        config = json.loads(f.read())
+    return (
+        (config.get("auth", {}).get("token") if isinstance(config.get("auth"), dict) else None)
+        or config.get("access_token")
+        or config.get("jwt_token")
+    )
+
+
+def _load_token() -> str:
+    """Return the CLI auth token, re-reading the config only when it has changed."""
+    if not os.path.exists(_CONFIG_PATH):
+        raise Exception("Config file not found. Run 'scambus auth login' first.")
+    token = _read_token(_CONFIG_PATH, os.stat(_CONFIG_PATH).st_mtime)
+    if not token:
+        raise Exception("No token found in config file")
+    return token
+
 
 def test_stream_creation_with_helpers():
     """Test creating streams with the new identifier_types parameter."""
 
     # Get client with auth
-    import json
-
     api_url = os.environ.get("SCAMBUS_URL", "http://localhost:8080/api")
-
-    # Try to read from config file
-    config_path = os.path.expanduser("~/.scambus/config.json")
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            config = json.load(f)
-            token = (
-                (
-                    config.get("auth", {}).get("token")
-                    if isinstance(config.get("auth"), dict)
-                    else None
-                )
-                or config.get("access_token")
-                or config.get("jwt_token")
-            )
-            if token:
-                client = ScambusClient(api_url=api_url, api_token=token)
-            else:
-                raise Exception("No token found in config file")
-    else:
-        raise Exception("Config file not found. Run 'scambus auth login' first.")
+    client = ScambusClient(api_url=api_url, api_token=_load_token())
 
     print("=" * 70)
     print("  Testing Stream Creation with identifier_types Helper")
     print("=" * 70)
     print()
 
-    # Test 1: Single identifier type
-    print("Test 1: Creating stream with single identifier type (phone)...")
-    stream1 = client.create_stream(
-        name="E2E Test - Phone Numbers Only",
-        data_type="identifier",
-        identifier_types="phone",
-        min_confidence=0.8,
-    )
-    print(f"  ✓ Stream created: {stream1.id}")
-    print(f"    Stream name: {stream1.name}")
-    print()
+    # Tests 1-3 create independent streams, so the requests run concurrently
+    stream_specs = [
+        (
+            "Test 1: Creating stream with single identifier type (phone)...",
+            {
+                "name": "E2E Test - Phone Numbers Only",
+                "data_type": "identifier",
+                "identifier_types": "phone",
+                "min_confidence": 0.8,
+            },
+        ),
+        (
+            "Test 2: Creating stream with multiple identifier types (phone, email)...",
+            {
+                "name": "E2E Test - Contact Info",
+                "data_type": "identifier",
+                "identifier_types": ["phone", "email"],
+                "min_confidence": 0.9,
+            },
+        ),
+        (
+            "Test 3: Creating stream with identifier type + custom filter...",
+            {
+                "name": "E2E Test - WhatsApp Only",
+                "data_type": "identifier",
+                "identifier_types": "social_media",
+                "filter_expression": '$.details.platform == "whatsapp"',
+                "min_confidence": 0.85,
+            },
+        ),
+    ]
+    with ThreadPoolExecutor(max_workers=len(stream_specs)) as executor:
+        stream1, stream2, stream3 = executor.map(
+            lambda spec: client.create_stream(**spec[1]), stream_specs
+        )
 
-    # Test 2: Multiple identifier types
-    print("Test 2: Creating stream with multiple identifier types (phone, email)...")
-    stream2 = client.create_stream(
-        name="E2E Test - Contact Info",
-        data_type="identifier",
-        identifier_types=["phone", "email"],
-        min_confidence=0.9,
-    )
-    print(f"  ✓ Stream created: {stream2.id}")
-    print(f"    Stream name: {stream2.name}")
-    print()
-
-    # Test 3: Identifier type + custom filter
-    print("Test 3: Creating stream with identifier type + custom filter...")
-    stream3 = client.create_stream(
-        name="E2E Test - WhatsApp Only",
-        data_type="identifier",
-        identifier_types="social_media",
-        filter_expression='$.details.platform == "whatsapp"',
-        min_confidence=0.85,
-    )
-    print(f"  ✓ Stream created: {stream3.id}")
-    print(f"    Stream name: {stream3.name}")
-    print()
+    for (description, _), stream in zip(stream_specs, (stream1, stream2, stream3)):
+        print(description)
+        print(f"  ✓ Stream created: {stream.id}")
+        print(f"    Stream name: {stream.name}")
+        print()
 
     # Test 4: List all streams to verify
     print("Test 4: Listing streams to verify...")
@@ -91,12 +103,12 @@ def test_stream_creation_with_helpers():
 
     # Cleanup
     print("Cleanup: Deleting test streams...")
-    client.delete_stream(stream1.id)
-    print(f"  ✓ Deleted stream: {stream1.id}")
-    client.delete_stream(stream2.id)
-    print(f"  ✓ Deleted stream: {stream2.id}")
-    client.delete_stream(stream3.id)
-    print(f"  ✓ Deleted stream: {stream3.id}")
+    # The deletes are independent, so issue them concurrently over the session's pool
+    stream_ids = [stream1.id, stream2.id, stream3.id]
+    with ThreadPoolExecutor(max_workers=len(stream_ids)) as executor:
+        list(executor.map(client.delete_stream, stream_ids))
+    for stream_id in stream_ids:
+        print(f"  ✓ Deleted stream: {stream_id}")
     print()
 
     print("=" * 70)
@@ -1,40 +1,165 @@
 """Shared pytest fixtures for scambus-client tests."""
 
-from unittest.mock import Mock
+import socket
+from collections import deque
+from types import MappingProxyType
+from unittest.mock import Mock, create_autospec
 
 import pytest
+import requests
 
 from scambus_client import ScambusClient
+from scambus_client.models import Case, ExportStream, Identifier, JournalEntry, Media, Tag
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_key():
     """Return a mock API key."""
     return "test-api-key-12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_url():
     """Return a mock API URL."""
     return "https://api.test.scambus.net"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(mock_api_url, mock_api_key):
-    """Return a ScambusClient instance with mocked requests."""
-    from unittest.mock import Mock
+    """Return a session-wide ScambusClient instance with mocked requests.
 
+    The client is built once; ``_reset_client`` restores its attributes and session
+    headers around every test.
+    """
     # Create client with real session first
     client = ScambusClient(api_url=mock_api_url, api_token=mock_api_key)
 
-    # Replace session with a mock that tests can configure
-    mock_session = Mock()
+    # Replace session with a mock that tests can configure. Autospeccing it from
+    # requests.Session makes misspelt attributes and bad call signatures fail.
+    mock_session = create_autospec(requests.Session, instance=True)
     mock_session.headers = client.session.headers  # Keep the auth headers
     client.session = mock_session
 
     return client
 
 
+@pytest.fixture(autouse=True)
+def _no_network(request, monkeypatch):
+    """Fail fast if a unit test reaches for the network instead of a mock.
+
+    Tests marked ``integration`` are left alone.
+    """
+    if request.node.get_closest_marker("integration"):
+        return
+
+    def _blocked(*args, **kwargs):
+        raise RuntimeError(
+            "Network access is disabled in unit tests; mark the test with "
+            "@pytest.mark.integration if it really needs a backend"
+        )
+
+    monkeypatch.setattr(socket, "getaddrinfo", _blocked)
+    monkeypatch.setattr(socket.socket, "connect", _blocked)
+    monkeypatch.setattr(socket.socket, "connect_ex", _blocked)
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(client):
+    """Clear the shared client's mocked session and undo any changes a test made to it.
+
+    Every client attribute and the session headers are snapshotted before the test
+    and restored afterwards, so no test can leak configuration into the next one.
+    """
+    attributes = dict(client.__dict__)
+    headers = client.session.headers.copy()
+    client.session.request.reset_mock(return_value=True, side_effect=True)
+    yield
+    client.__dict__.clear()
+    client.__dict__.update(attributes)
+    client.session.headers = headers
+
+
+class FakeResponse:
+    """Minimal stand-in for ``requests.Response`` with a fixed JSON payload."""
+
+    __slots__ = ("status_code", "_json", "headers", "text")
+
+    def __init__(self, status_code, json_data, headers=None):
+        self.status_code = status_code
+        self._json = json_data
+        self.headers = headers or {}
+        self.text = ""
+
+    def json(self):
+        """Return the canned JSON payload."""
+        return self._json
+
+
+@pytest.fixture(scope="session")
+def resp():
+    """Return the FakeResponse factory: ``resp(status_code, json_data)``."""
+    return FakeResponse
+
+
+@pytest.fixture(scope="session")
+def last_json(client):
+    """Return a helper giving the JSON body sent with a mocked request.
+
+    ``last_json()`` reads the most recent request; pass an index into the call
+    list to read an earlier one. Requests without a body yield ``{}``.
+    """
+
+    def _last_json(index=-1):
+        return client.session.request.call_args_list[index].kwargs.get("json") or {}
+
+    return _last_json
+
+
+@pytest.fixture(scope="session")
+def last_params(client):
+    """Return a helper giving the query params sent with the most recent mocked request."""
+
+    def _last_params():
+        return client.session.request.call_args.kwargs.get("params") or {}
+
+    return _last_params
+
+
+@pytest.fixture
+def script(client):
+    """Return a deque of responses that the mocked session hands out in order.
+
+    Each request pops the next response; a request with nothing left queued
+    raises IndexError from the test's own call.
+    """
+    queue = deque()
+    client.session.request.side_effect = lambda *args, **kwargs: queue.popleft()
+    return queue
+
+
+@pytest.fixture
+def wire_create_entry(script, resp):
+    """Return a helper that queues the POST + GET responses of a journal entry create.
+
+    Create methods POST the entry, which answers with just the new ID, and then
+    GET the full entry, which comes back wrapped as
+    ``{"journal_entry": {"journal_entry": {...}, "can_edit": bool}, "cases": [...]}``.
+    """
+
+    def _wire(entry_id, entry_data):
+        script.extend(
+            [
+                resp(201, {"id": entry_id}),
+                resp(
+                    200,
+                    {"journal_entry": {"journal_entry": entry_data, "can_edit": True}, "cases": []},
+                ),
+            ]
+        )
+
+    return _wire
+
+
 @pytest.fixture
 def mock_response():
     """Return a mock requests.Response object."""
@@ -44,10 +169,11 @@ def mock_response():
     return response
 
 
-@pytest.fixture
-def mock_journal_entry_data():
-    """Return mock journal entry data."""
-    return {
+# Mock API payloads are shared by every test in the session. The top level is
+# read-only; take a dict() copy before changing fields, and never mutate the
+# nested values.
+_MOCK_JOURNAL_ENTRY_DATA = MappingProxyType(
+    {
         "id": "entry-123",
         "type": "detection",
         "description": "Test detection",
@@ -71,12 +197,17 @@ def mock_journal_entry_data():
         "created_at": "2025-01-15T10:00:00Z",
         "updated_at": "2025-01-15T10:00:00Z",
     }
+)
 
 
-@pytest.fixture
-def mock_phone_call_data():
-    """Return mock phone call journal entry data."""
-    return {
+@pytest.fixture(scope="session")
+def mock_journal_entry_data():
+    """Return the mock journal entry data as a read-only mapping."""
+    return _MOCK_JOURNAL_ENTRY_DATA
+
+
+_MOCK_PHONE_CALL_DATA = MappingProxyType(
+    {
         "id": "entry-456",
         "type": "phone_call",
         "description": "Scam call received",
@@ -100,12 +231,17 @@ def mock_phone_call_data():
         "created_at": "2025-01-15T11:00:00Z",
         "updated_at": "2025-01-15T11:00:00Z",
     }
+)
 
 
-@pytest.fixture
-def mock_identifier_data():
-    """Return mock identifier data."""
-    return {
+@pytest.fixture(scope="session")
+def mock_phone_call_data():
+    """Return the mock phone call journal entry data as a read-only mapping."""
+    return _MOCK_PHONE_CALL_DATA
+
+
+_MOCK_IDENTIFIER_DATA = MappingProxyType(
+    {
         "id": "ident-789",
         "type": "email",
         "value": "scammer@example.com",
@@ -114,12 +250,17 @@ def mock_identifier_data():
         "createdAt": "2025-01-01T00:00:00Z",
         "updatedAt": "2025-01-15T12:00:00Z",
     }
+)
 
 
-@pytest.fixture
-def mock_case_data():
-    """Return mock case data."""
-    return {
+@pytest.fixture(scope="session")
+def mock_identifier_data():
+    """Return the mock identifier data as a read-only mapping."""
+    return _MOCK_IDENTIFIER_DATA
+
+
+_MOCK_CASE_DATA = MappingProxyType(
+    {
         "id": "case-321",
         "title": "Phishing Campaign Investigation",
         "notes": "Investigating coordinated phishing campaign",
@@ -128,12 +269,17 @@ def mock_case_data():
         "updatedAt": "2025-01-15T00:00:00Z",
         "createdBy": "user-123",
     }
+)
 
 
-@pytest.fixture
-def mock_stream_data():
-    """Return mock export stream data."""
-    return {
+@pytest.fixture(scope="session")
+def mock_case_data():
+    """Return the mock case data as a read-only mapping."""
+    return _MOCK_CASE_DATA
+
+
+_MOCK_STREAM_DATA = MappingProxyType(
+    {
         "id": "stream-555",
         "name": "Phone Scams Stream",
         "dataType": "journal_entry",
@@ -144,24 +290,34 @@ def mock_stream_data():
         "createdAt": "2025-01-14T00:00:00Z",
         "updatedAt": "2025-01-14T00:00:00Z",
     }
+)
 
 
-@pytest.fixture
-def mock_tag_data():
-    """Return mock tag data."""
-    return {
+@pytest.fixture(scope="session")
+def mock_stream_data():
+    """Return the mock export stream data as a read-only mapping."""
+    return _MOCK_STREAM_DATA
+
+
+_MOCK_TAG_DATA = MappingProxyType(
+    {
         "id": "tag-999",
         "title": "High Priority",
         "tag_type": "valued",
         "description": "High priority items",
         "created_at": "2025-01-01T00:00:00Z",
     }
+)
 
 
-@pytest.fixture
-def mock_media_data():
-    """Return mock media data."""
-    return {
+@pytest.fixture(scope="session")
+def mock_tag_data():
+    """Return the mock tag data as a read-only mapping."""
+    return _MOCK_TAG_DATA
+
+
+_MOCK_MEDIA_DATA = MappingProxyType(
+    {
         "id": "media-777",
         "type": "s3",
         "fileName": "screenshot.png",
@@ -170,3 +326,52 @@ def mock_media_data():
         "uploadedAt": "2025-01-15T09:00:00Z",
         "notes": "Screenshot of phishing website",
     }
+)
+
+
+@pytest.fixture(scope="session")
+def mock_media_data():
+    """Return the mock media data as a read-only mapping."""
+    return _MOCK_MEDIA_DATA
+
+
+@pytest.fixture(scope="session")
+def expected_journal_entry():
+    """Return the JournalEntry decoded from the mock journal entry data."""
+    return JournalEntry.from_dict(_MOCK_JOURNAL_ENTRY_DATA)
+
+
+@pytest.fixture(scope="session")
+def expected_phone_call():
+    """Return the JournalEntry decoded from the mock phone call data."""
+    return JournalEntry.from_dict(_MOCK_PHONE_CALL_DATA)
+
+
+@pytest.fixture(scope="session")
+def expected_identifier():
+    """Return the Identifier decoded from the mock identifier data."""
+    return Identifier.from_dict(_MOCK_IDENTIFIER_DATA)
+
+
+@pytest.fixture(scope="session")
+def expected_case():
+    """Return the Case decoded from the mock case data."""
+    return Case.from_dict(_MOCK_CASE_DATA)
+
+
+@pytest.fixture(scope="session")
+def expected_stream():
+    """Return the ExportStream decoded from the mock export stream data."""
+    return ExportStream.from_dict(_MOCK_STREAM_DATA)
+
+
+@pytest.fixture(scope="session")
+def expected_media():
+    """Return the Media decoded from the mock media data."""
+    return Media.from_dict(_MOCK_MEDIA_DATA)
+
+
+@pytest.fixture(scope="session")
+def expected_tag():
+    """Return the Tag decoded from the mock tag data."""
+    return Tag.from_dict(_MOCK_TAG_DATA)
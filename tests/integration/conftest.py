@@ -0,0 +1,20 @@
+"""Shared pytest fixtures for scambus-client integration tests."""
+
+import os
+
+import pytest
+
+from scambus_client import ScambusClient
+
+
+@pytest.fixture(scope="session")
+def integration_client():
+    """Create a client for integration testing, shared by every integration module.
+
+    Sharing one client reuses its session's pooled connections, so the TLS
+    handshake and authentication are paid once per test run.
+    """
+    return ScambusClient(
+        api_url=os.getenv("SCAMBUS_TEST_URL"),
+        api_token=os.getenv("SCAMBUS_TEST_API_KEY"),
+    )
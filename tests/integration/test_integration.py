@@ -13,8 +13,6 @@ from datetime import datetime, timezone
 
 import pytest
 
-from scambus_client import ScambusClient
-
 # Skip all integration tests if environment variables are not set
 pytestmark = pytest.mark.skipif(
     not os.getenv("SCAMBUS_TEST_URL") or not os.getenv("SCAMBUS_TEST_API_KEY"),
@@ -22,15 +20,6 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture(scope="module")
-def integration_client():
-    """Create a client for integration testing."""
-    return ScambusClient(
-        base_url=os.getenv("SCAMBUS_TEST_URL"),
-        api_key=os.getenv("SCAMBUS_TEST_API_KEY"),
-    )
-
-
 @pytest.mark.integration
 class TestIntegrationJournalEntries:
     """Integration tests for journal entries."""
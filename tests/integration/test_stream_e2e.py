@@ -8,7 +8,6 @@ Exercises: create_stream(), get_stream_info(), consume_stream(), SSE consumption
 Requirements:
     - Running Scambus backend at http://localhost:8080/api (or configured URL)
     - API key credentials (SCAMBUS_API_KEY_ID + SCAMBUS_API_KEY_SECRET)
-    - pip install sseclient-py
 
 Run:
     SCAMBUS_API_KEY_ID="<key-id>" SCAMBUS_API_KEY_SECRET="<secret>" \\
@@ -17,18 +16,52 @@ Run:
     Or set SCAMBUS_API_URL to override the API base URL (default: http://localhost:8080/api).
 """
 
+import http.client
 import json
 import os
 import sys
 import threading
 import time
 import uuid
-
-import requests
-import sseclient
+from urllib.parse import urlencode, urlsplit
 
 from scambus_client import ScambusClient, IdentifierLookup
 
+# orjson (from the speedups extra) parses SSE payloads faster; fall back to stdlib json
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Query string for the SSE stream: start from new messages, include is_test data
+_SSE_QUERY = urlencode({"cursor": "$", "include_test": "true"})
+
+
+def _sse_headers(api_key_header):
+    """Return the request headers for the SSE stream."""
+    return {"X-API-Key": api_key_header, "Accept": "text/event-stream"}
+
+
+def _iter_sse_events(resp):
+    """Yield (event, data) byte pairs from a streaming text/event-stream response."""
+    event, data = None, []
+    # HTTPResponse.readline() undoes chunked transfer encoding, unlike reading resp.fp
+    for raw_line in resp:
+        line = raw_line.rstrip(b"\r\n")
+        if not line:
+            # A blank line ends the event
+            if event or data:
+                yield event or b"message", b"\n".join(data)
+            event, data = None, []
+        elif line.startswith(b"data:"):
+            data.append(line[6:] if line[5:6] == b" " else line[5:])
+        elif line.startswith(b"event:"):
+            event = line[6:].strip()
+        # Comments (":") and id/retry fields are not needed here
+
 
 def main():
     # --- Setup ---
@@ -89,38 +122,45 @@ def main():
         print("[3/7] Starting SSE listener...")
         sse_messages = []
         sse_connected = threading.Event()
+        got_message = threading.Event()
         sse_error = []
 
         def sse_listener():
             try:
-                url = f"{api_url}/consume/{consumer_key}/stream"
-                headers = {
-                    "X-API-Key": api_key_header,
-                    "Accept": "text/event-stream",
-                }
-                params = {"cursor": "$", "include_test": "true"}
-
-                resp = requests.get(url, headers=headers, params=params, stream=True, timeout=60)
-                resp.raise_for_status()
-
-                sse_client = sseclient.SSEClient(resp)
-                for event in sse_client.events():
-                    if event.event == "connected":
+                # Plain http.client: once the stream is open we only read lines from it
+                url = urlsplit(f"{api_url}/consume/{consumer_key}/stream")
+                headers = _sse_headers(api_key_header)
+
+                if url.scheme == "https":
+                    conn = http.client.HTTPSConnection(url.netloc, timeout=60)
+                else:
+                    conn = http.client.HTTPConnection(url.netloc, timeout=60)
+                conn.request("GET", f"{url.path}?{_SSE_QUERY}", headers=headers)
+                resp = conn.getresponse()
+                if resp.status >= 400:
+                    raise RuntimeError(f"SSE request failed: {resp.status} {resp.reason}")
+
+                append = sse_messages.append
+                extend = sse_messages.extend
+                for event, data in _iter_sse_events(resp):
+                    if event == b"connected":
                         sse_connected.set()
-                    elif event.event == "message":
+                    elif event == b"message":
+                        # Both parsers accept bytes and raise ValueError subclasses on bad JSON
                         try:
-                            msg = json.loads(event.data)
-                            sse_messages.append(msg)
-                        except json.JSONDecodeError:
+                            append(_json_loads(data))
+                            got_message.set()
+                        except ValueError:
                             pass
-                    elif event.event == "batch":
+                    elif event == b"batch":
                         try:
-                            msgs = json.loads(event.data)
-                            sse_messages.extend(msgs)
-                        except json.JSONDecodeError:
+                            extend(_json_loads(data))
+                            if sse_messages:
+                                got_message.set()
+                        except ValueError:
                             pass
-                    elif event.event == "error":
-                        sse_error.append(event.data)
+                    elif event == b"error":
+                        sse_error.append(data.decode("utf-8", "replace"))
             except Exception as e:
                 sse_error.append(str(e))
                 sse_connected.set()  # unblock main thread on error
@@ -164,13 +204,9 @@ def main():
 
         # --- Step 6: Wait for SSE message ---
         print("[6/7] Waiting for SSE message (up to 15s)...")
-        deadline = time.time() + 15
-        while time.time() < deadline:
-            if sse_messages:
-                # Wait a bit more to collect additional messages
-                time.sleep(2)
-                break
-            time.sleep(0.25)
+        if got_message.wait(timeout=15):
+            # Wait a bit more to collect additional messages
+            time.sleep(2)
 
         if sse_error:
             print(f"  SSE error: {sse_error}")
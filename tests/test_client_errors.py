@@ -0,0 +1,56 @@
+"""Unit tests for ScambusClient error handling."""
+
+import pytest
+
+from scambus_client import (
+    ScambusAPIError,
+    ScambusAuthenticationError,
+    ScambusNotFoundError,
+    ScambusValidationError,
+)
+
+
+class TestScambusClientErrorHandling:
+    """Test error handling."""
+
+    @pytest.mark.parametrize(
+        "status_code, payload, expected_error, call",
+        [
+            (
+                401,
+                {"error": "Invalid API key"},
+                ScambusAuthenticationError,
+                lambda c: c.create_detection(
+                    description="Test", identifiers=["email:test@example.com"]
+                ),
+            ),
+            (
+                400,
+                {"error": "Validation failed", "details": {"field": "description is required"}},
+                ScambusValidationError,
+                lambda c: c.create_detection(description="", identifiers=[]),
+            ),
+            (
+                404,
+                {"error": "Resource not found"},
+                ScambusNotFoundError,
+                lambda c: c.get_case("nonexistent-case-id"),
+            ),
+            (
+                500,
+                {"error": "Internal server error"},
+                ScambusAPIError,
+                lambda c: c.create_detection(
+                    description="Test", identifiers=["email:test@example.com"]
+                ),
+            ),
+        ],
+        ids=["authentication", "validation", "not_found", "server"],
+    )
+    def test_error_status_raises(self, client, resp, status_code, payload, expected_error, call):
+        """Test each error status maps to its exception type."""
+        client.session.request.return_value = resp(status_code, payload)
+        client.max_retries = 0
+
+        with pytest.raises(expected_error):
+            call(client)
@@ -0,0 +1,44 @@
+"""Unit tests for the ScambusClient filter expression helpers."""
+
+import pytest
+
+from scambus_client import (
+    InvalidConfidenceError,
+    InvalidIdentifierTypeError,
+    build_combined_filter,
+    build_identifier_type_filter,
+)
+
+
+class TestFilterHelpers:
+    """Test the JSONPath filter expression helpers."""
+
+    def test_identifier_type_filter_accepts_any_sequence(self):
+        """Test lists and tuples of the same types build the same expression."""
+        expected = '$.type == "phone" || $.type == "email"'
+
+        assert build_identifier_type_filter(["phone", "email"]) == expected
+        assert build_identifier_type_filter(("phone", "email")) == expected
+
+    def test_combined_filter_wraps_multiple_types_from_tuple(self):
+        """Test multiple types passed as a tuple are parenthesized like a list."""
+        result = build_combined_filter(identifier_types=("phone", "email"), min_confidence=0.9)
+
+        assert result == '($.type == "phone" || $.type == "email") && $.confidence >= 0.9'
+
+    def test_combined_filter_rejects_inverted_confidence_range(self):
+        """Test a min_confidence above max_confidence is rejected."""
+        with pytest.raises(InvalidConfidenceError):
+            build_combined_filter(min_confidence=0.9, max_confidence=0.5)
+
+    def test_invalid_identifier_type_error_is_value_error(self):
+        """Test the filter builder's type error can still be caught as ValueError."""
+        with pytest.raises(InvalidIdentifierTypeError):
+            build_identifier_type_filter("invalid_type")
+        with pytest.raises(ValueError):
+            build_identifier_type_filter(["phone", "invalid_type"])
+
+    def test_combined_filter_cache_keeps_numeric_literal(self):
+        """Test equal ints and floats render their own literal despite the cache."""
+        assert build_combined_filter(min_confidence=1) == "$.confidence >= 1"
+        assert build_combined_filter(min_confidence=1.0) == "$.confidence >= 1.0"
@@ -0,0 +1,27 @@
+"""Unit tests for ScambusClient initialization."""
+
+import pytest
+
+from scambus_client import ScambusClient
+
+
+class TestScambusClientInit:
+    """Test ScambusClient initialization."""
+
+    def test_init_with_credentials(self, mock_api_url, mock_api_key):
+        """Test client initialization with API token."""
+        client = ScambusClient(api_url=mock_api_url, api_token=mock_api_key)
+        # Client appends /api if not already present
+        assert client.api_url == f"{mock_api_url}/api"
+        assert client.session is not None
+        assert "Authorization" in client.session.headers
+
+    def test_init_without_api_key(self, mock_api_url, monkeypatch):
+        """Test client initialization without API key raises ValueError."""
+        monkeypatch.setattr("scambus_client.client.get_api_token", lambda api_token=None: None)
+        monkeypatch.setattr("scambus_client.client.get_api_key_id", lambda api_key_id=None: None)
+        monkeypatch.setattr(
+            "scambus_client.client.get_api_key_secret", lambda api_key_secret=None: None
+        )
+        with pytest.raises(ValueError, match="No authentication provided"):
+            ScambusClient(api_url=mock_api_url)
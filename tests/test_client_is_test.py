@@ -0,0 +1,94 @@
+"""Unit tests for ScambusClient is_test filtering."""
+
+import pytest
+
+
+class TestIsTestFiltering:
+    """Test that is_test filtering works correctly."""
+
+    @pytest.mark.parametrize(
+        "kwargs, expected", [({}, None), ({"include_test": True}, True)], ids=["default", "include"]
+    )
+    def test_query_journal_entries_is_test(
+        self, client, mock_journal_entry_data, resp, last_json, kwargs, expected
+    ):
+        """Test that query_journal_entries only requests test data when include_test=True."""
+        mock_response = resp(
+            200,
+            {
+                "data": [mock_journal_entry_data],
+                "nextCursor": None,
+                "hasMore": False,
+                "count": 1,
+            },
+        )
+        client.session.request.return_value = mock_response
+
+        client.query_journal_entries(**kwargs)
+
+        assert "includeTest" not in last_json()
+        assert last_json().get("is_test") is expected
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [({}, None), ({"include_test": True}, "true")],
+        ids=["default", "include"],
+    )
+    def test_list_cases_is_test(self, client, mock_case_data, resp, last_params, kwargs, expected):
+        """Test that list_cases only sends the includeTest param when include_test=True."""
+        mock_response = resp(200, {"data": [mock_case_data]})
+        client.session.request.return_value = mock_response
+
+        client.list_cases(**kwargs)
+
+        assert last_params().get("includeTest") == expected
+
+    @pytest.mark.parametrize(
+        "kwargs, expected", [({}, None), ({"include_test": True}, True)], ids=["default", "include"]
+    )
+    def test_search_identifiers_is_test(
+        self, client, mock_identifier_data, resp, last_json, kwargs, expected
+    ):
+        """Test that search_identifiers only requests test data when include_test=True."""
+        mock_response = resp(
+            200,
+            {
+                "data": [mock_identifier_data],
+                "nextCursor": None,
+                "hasMore": False,
+            },
+        )
+        client.session.request.return_value = mock_response
+
+        client.search_identifiers(query="test", **kwargs)
+
+        assert "includeTest" not in last_json()
+        assert last_json().get("is_test") is expected
+
+    def test_create_journal_entry_with_is_test(
+        self, client, mock_journal_entry_data, wire_create_entry, last_json
+    ):
+        """Test that create_journal_entry passes is_test flag correctly."""
+        test_entry_data = dict(mock_journal_entry_data)
+        test_entry_data["is_test"] = True
+        wire_create_entry("entry-test-123", test_entry_data)
+
+        client.create_detection(
+            description="Test detection", identifiers=["email:test@example.com"], is_test=True
+        )
+
+        # Verify the POST request (the first of POST + GET) included is_test
+        assert last_json(0).get("is_test") is True
+
+    def test_create_case_with_is_test(self, client, mock_case_data, resp, last_json):
+        """Test that create_case passes is_test flag correctly."""
+        test_case_data = dict(mock_case_data)
+        test_case_data["is_test"] = True
+
+        mock_response = resp(201, test_case_data)
+        client.session.request.return_value = mock_response
+
+        client.create_case(title="Test Case", is_test=True)
+
+        # Verify the POST request included is_test
+        assert last_json().get("is_test") is True
@@ -0,0 +1,79 @@
+"""Unit tests for ScambusClient journal entry methods."""
+
+from dataclasses import fields
+from datetime import datetime, timezone
+
+# Call times used by the phone call tests, matching the mock payloads
+T_1100 = datetime(2025, 1, 15, 11, 0, 0, tzinfo=timezone.utc)
+T_1110 = datetime(2025, 1, 15, 11, 10, 0, tzinfo=timezone.utc)
+T_1200 = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _public_fields(entry):
+    """Return an entry's public dataclass fields, leaving out internal ones like _client."""
+    return {f.name: getattr(entry, f.name) for f in fields(entry) if not f.name.startswith("_")}
+
+
+class TestScambusClientJournalEntries:
+    """Test journal entry methods."""
+
+    def test_create_detection(
+        self, client, mock_journal_entry_data, expected_journal_entry, wire_create_entry
+    ):
+        """Test creating a detection journal entry."""
+        wire_create_entry("entry-123", mock_journal_entry_data)
+
+        entry = client.create_detection(
+            description="Test detection",
+            identifiers=["email:scammer@example.com"],
+            details={"data": {"threat_type": "phishing"}},
+        )
+
+        assert _public_fields(entry) == _public_fields(expected_journal_entry)
+        assert entry._client is client
+        assert client.session.request.call_count == 2  # POST + GET
+
+    def test_create_phone_call(
+        self, client, mock_phone_call_data, expected_phone_call, wire_create_entry
+    ):
+        """Test creating a phone call journal entry."""
+        wire_create_entry("entry-456", mock_phone_call_data)
+
+        entry = client.create_phone_call(
+            description="Scam call",
+            direction="inbound",
+            start_time=T_1100,
+            end_time=T_1110,
+            identifiers=["phone:+1234567890"],
+        )
+
+        assert _public_fields(entry) == _public_fields(expected_phone_call)
+        assert entry._client is client
+        assert client.session.request.call_count == 2  # POST + GET
+
+    def test_create_in_progress_activity(self, client, wire_create_entry):
+        """Test creating an in-progress activity."""
+        in_progress_data = {
+            "id": "entry-in-progress",
+            "type": "phone_call",
+            "description": "Ongoing call",
+            "start_time": "2025-01-15T12:00:00Z",
+            "end_time": None,
+            "details": {"direction": "inbound"},
+        }
+
+        wire_create_entry("entry-in-progress", in_progress_data)
+
+        # Even for in-progress, current signature requires end_time
+        # The in_progress flag tells the backend to omit it
+        entry = client.create_phone_call(
+            description="Ongoing call",
+            direction="inbound",
+            start_time=T_1200,
+            end_time=T_1200,
+            in_progress=True,
+        )
+
+        assert entry.id == "entry-in-progress"
+        assert entry.type == "phone_call"
+        assert client.session.request.call_count == 2  # POST + GET
@@ -0,0 +1,53 @@
+"""Unit tests for ScambusClient search methods."""
+
+
+class TestScambusClientSearch:
+    """Test search methods."""
+
+    def test_search_identifiers(
+        self, client, mock_identifier_data, expected_identifier, resp, last_json
+    ):
+        """Test searching for identifiers."""
+        # Backend returns {data: [], nextCursor, hasMore} - NOT a plain list
+        mock_response = resp(
+            200,
+            {
+                "data": [mock_identifier_data],
+                "nextCursor": None,
+                "hasMore": False,
+            },
+        )
+        client.session.request.return_value = mock_response
+
+        results = client.search_identifiers(query="scammer@example.com", types=["email"])
+
+        # Verify the request was made correctly
+        client.session.request.assert_called_once()
+
+        # Verify correct parameters were sent
+        json_data = last_json()
+        assert json_data["search_query"] == "scammer@example.com"  # Backend expects search_query
+        assert json_data["type"] == "email"  # Backend expects type (singular)
+        assert "types" not in json_data  # Backend doesn't accept types (plural)
+
+        assert results["data"] == [expected_identifier]
+
+    def test_search_identifiers_empty_results(self, client, resp):
+        """Test searching for identifiers with no results."""
+        mock_response = resp(200, {"data": [], "nextCursor": None, "hasMore": False})
+        client.session.request.return_value = mock_response
+
+        result = client.search_identifiers(query="nonexistent")
+
+        assert len(result["data"]) == 0
+        assert isinstance(result["data"], list)
+
+    def test_search_cases(self, client, mock_case_data, expected_case, resp):
+        """Test searching for cases."""
+        # API returns a plain list, not wrapped in results/total
+        mock_response = resp(200, [mock_case_data])
+        client.session.request.return_value = mock_response
+
+        results = client.search_cases(query="phishing", status="open")
+
+        assert results == [expected_case]
@@ -0,0 +1,51 @@
+"""Unit tests for ScambusClient export stream methods."""
+
+
+class TestScambusClientStreams:
+    """Test stream methods."""
+
+    def test_create_stream(self, client, mock_stream_data, expected_stream, resp):
+        """Test creating an export stream."""
+        mock_response = resp(201, mock_stream_data)
+        client.session.request.return_value = mock_response
+
+        stream = client.create_stream(
+            name="Phone Scams Stream",
+            data_type="journal_entry",
+            identifier_types=["phone"],
+            min_confidence=0.8,
+        )
+
+        assert stream == expected_stream
+
+    def test_list_streams(self, client, mock_stream_data, expected_stream, resp):
+        """Test listing export streams."""
+        # API returns data wrapped in {"data": [...], "pagination": {...}}
+        mock_response = resp(200, {"data": [mock_stream_data], "pagination": {}})
+        client.session.request.return_value = mock_response
+
+        result = client.list_streams()
+
+        # list_streams returns a dict with 'data' and 'pagination'
+        assert "data" in result
+        assert result["data"] == [expected_stream]
+
+    def test_consume_stream(self, client, mock_journal_entry_data, resp):
+        """Test consuming from a stream."""
+        mock_response = resp(
+            200,
+            {
+                "messages": [mock_journal_entry_data],
+                "next_cursor": "new-cursor",
+                "has_more": False,
+            },
+        )
+        client.session.request.return_value = mock_response
+
+        result = client.consume_stream("stream-555", limit=10)
+
+        assert isinstance(result, dict)
+        assert "messages" in result
+        assert "next_cursor" in result
+        assert len(result["messages"]) == 1
+        assert result["next_cursor"] == "new-cursor"
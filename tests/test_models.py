@@ -1,13 +1,15 @@
 """Unit tests for Scambus models."""
 
+import warnings
+from datetime import datetime
+
+import pytest
+
 from scambus_client.models import (
-    Case,
     DetectionDetails,
     EmailDetails,
     ExportStream,
-    Identifier,
     JournalEntry,
-    Media,
     PhoneCallDetails,
     Tag,
 )
@@ -16,9 +18,9 @@ from scambus_client.models import (
 class TestJournalEntry:
     """Test JournalEntry model."""
 
-    def test_journal_entry_creation(self, mock_journal_entry_data):
+    def test_journal_entry_creation(self, expected_journal_entry):
         """Test creating a journal entry from data."""
-        entry = JournalEntry.from_dict(mock_journal_entry_data)
+        entry = expected_journal_entry
 
         assert entry.id == "entry-123"
         assert entry.type == "detection"
@@ -27,9 +29,9 @@ class TestJournalEntry:
         assert entry.details["category"] == "phishing"
         assert entry.details["confidence"] == 0.9
 
-    def test_journal_entry_with_phone_call_details(self, mock_phone_call_data):
+    def test_journal_entry_with_phone_call_details(self, expected_phone_call):
         """Test journal entry with phone call details."""
-        entry = JournalEntry.from_dict(mock_phone_call_data)
+        entry = expected_phone_call
 
         assert entry.type == "phone_call"
         assert isinstance(entry.details, dict)
@@ -80,56 +82,34 @@ class TestDetectionDetails:
         assert "category" not in data
         assert "confidence" not in data
 
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_detection_details_to_dict_fallback_from_details(self):
         """Test that deprecated 'details' field falls back to 'data' key in to_dict."""
-        import warnings
-
-        with warnings.catch_warnings(record=True):
-            warnings.simplefilter("always")
-            det = DetectionDetails(
-                details={"legacy_key": "value"},
-            )
+        det = DetectionDetails(
+            details={"legacy_key": "value"},
+        )
         data = det.to_dict()
 
         assert data["data"] == {"legacy_key": "value"}
         assert "details" not in data
 
-    def test_detection_details_confidence_deprecation(self):
-        """Test that setting confidence emits a deprecation warning."""
-        import warnings
-
+    @pytest.mark.parametrize(
+        "field, value, needle",
+        [
+            ("confidence", 0.85, "IdentifierLookup"),
+            ("category", "phishing", "category"),
+            ("details", {"key": "val"}, "details"),
+        ],
+    )
+    def test_detection_details_deprecations(self, field, value, needle):
+        """Test that setting a deprecated field emits one deprecation warning."""
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            DetectionDetails(confidence=0.85)
-            assert len(w) == 1
-            assert issubclass(w[0].category, DeprecationWarning)
-            assert "IdentifierLookup" in str(w[0].message)
-
-    def test_detection_details_category_deprecation(self):
-        """Test that setting category emits a deprecation warning."""
-        import warnings
+            DetectionDetails(**{field: value})
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            DetectionDetails(category="phishing")
-            assert any(
-                issubclass(warning.category, DeprecationWarning)
-                and "category" in str(warning.message)
-                for warning in w
-            )
-
-    def test_detection_details_details_deprecation(self):
-        """Test that setting details emits a deprecation warning."""
-        import warnings
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            DetectionDetails(details={"key": "val"})
-            assert any(
-                issubclass(warning.category, DeprecationWarning)
-                and "details" in str(warning.message).lower()
-                for warning in w
-            )
+        assert len(w) == 1
+        assert issubclass(w[0].category, DeprecationWarning)
+        assert needle in str(w[0].message)
 
 
 class TestPhoneCallDetails:
@@ -161,8 +141,6 @@ class TestEmailDetails:
 
     def test_email_details_creation(self):
         """Test creating email details."""
-        from datetime import datetime
-
         sent_at = datetime(2025, 1, 15, 10, 0, 0)
         details = EmailDetails(
             direction="inbound",
@@ -181,9 +159,9 @@ class TestEmailDetails:
 class TestIdentifier:
     """Test Identifier model."""
 
-    def test_identifier_creation(self, mock_identifier_data):
+    def test_identifier_creation(self, expected_identifier):
         """Test creating an identifier from data."""
-        identifier = Identifier.from_dict(mock_identifier_data)
+        identifier = expected_identifier
 
         assert identifier.id == "ident-789"
         assert identifier.type == "email"
@@ -191,9 +169,9 @@ class TestIdentifier:
         assert identifier.confidence == 0.85
         assert identifier.created_at is not None
 
-    def test_identifier_attributes(self, mock_identifier_data):
+    def test_identifier_attributes(self, expected_identifier):
         """Test identifier attributes."""
-        identifier = Identifier.from_dict(mock_identifier_data)
+        identifier = expected_identifier
 
         assert identifier.display_value == "scammer@example.com"
         assert identifier.updated_at is not None
@@ -202,17 +180,17 @@ class TestIdentifier:
 class TestCase:
     """Test Case model."""
 
-    def test_case_creation(self, mock_case_data):
+    def test_case_creation(self, expected_case):
         """Test creating a case from data."""
-        case = Case.from_dict(mock_case_data)
+        case = expected_case
 
         assert case.id == "case-321"
         assert case.title == "Phishing Campaign Investigation"
         assert case.status == "open"
 
-    def test_case_timestamps(self, mock_case_data):
+    def test_case_timestamps(self, expected_case):
         """Test case timestamps."""
-        case = Case.from_dict(mock_case_data)
+        case = expected_case
 
         assert case.created_at is not None
         assert case.updated_at is not None
@@ -221,9 +199,9 @@ class TestCase:
 class TestExportStream:
     """Test ExportStream model."""
 
-    def test_stream_creation(self, mock_stream_data):
+    def test_stream_creation(self, expected_stream):
         """Test creating an export stream from data."""
-        stream = ExportStream.from_dict(mock_stream_data)
+        stream = expected_stream
 
         assert stream.id == "stream-555"
         assert stream.name == "Phone Scams Stream"
@@ -231,9 +209,20 @@ class TestExportStream:
         assert "phone" in stream.identifier_types
         assert stream.is_active is True
 
-    def test_stream_filters(self, mock_stream_data):
+    def test_stream_data_type_interned(self, mock_stream_data):
+        """Test closed-set data_type values share one interned string."""
+        first = ExportStream.from_dict(
+            dict(mock_stream_data, dataType="".join(["journal", "_entry"]))
+        )
+        second = ExportStream.from_dict(
+            dict(mock_stream_data, dataType="".join(["journal_", "entry"]))
+        )
+
+        assert first.data_type is second.data_type
+
+    def test_stream_filters(self, expected_stream):
         """Test stream filter settings."""
-        stream = ExportStream.from_dict(mock_stream_data)
+        stream = expected_stream
 
         assert stream.min_confidence == 0.8
         assert stream.max_confidence == 1.0
@@ -242,18 +231,18 @@ class TestExportStream:
 class TestMedia:
     """Test Media model."""
 
-    def test_media_creation(self, mock_media_data):
+    def test_media_creation(self, expected_media):
         """Test creating media from data."""
-        media = Media.from_dict(mock_media_data)
+        media = expected_media
 
         assert media.id == "media-777"
         assert media.file_name == "screenshot.png"
         assert media.mime_type == "image/png"
         assert media.file_size == 12345
 
-    def test_media_notes(self, mock_media_data):
+    def test_media_notes(self, expected_media):
         """Test media notes field."""
-        media = Media.from_dict(mock_media_data)
+        media = expected_media
 
         assert media.notes == "Screenshot of phishing website"
 
@@ -261,11 +250,30 @@ class TestMedia:
 class TestTag:
     """Test Tag model."""
 
-    def test_tag_creation(self, mock_tag_data):
+    def test_tag_creation(self, expected_tag):
         """Test creating a tag from data."""
-        tag = Tag.from_dict(mock_tag_data)
+        tag = expected_tag
 
         assert tag.id == "tag-999"
         assert tag.title == "High Priority"
         assert tag.tag_type == "valued"
         assert tag.description == "High priority items"
+
+    def test_tag_timestamps_parsed_lazily(self, mock_tag_data):
+        """Test tag timestamps are stored raw and parsed on first access."""
+        tag = Tag.from_dict(mock_tag_data)
+
+        assert tag.__dict__["_created_at_raw"] == "2025-01-01T00:00:00Z"
+        assert tag.created_at.year == 2025
+        assert tag.__dict__["_created_at_raw"] is tag.created_at
+        assert tag.updated_at is None
+
+    def test_tag_malformed_timestamp_raises_on_access(self, mock_tag_data):
+        """Test a malformed timestamp decodes but raises when the field is read."""
+        tag = Tag.from_dict(dict(mock_tag_data, created_at="not-a-timestamp"))
+
+        assert tag.id == "tag-999"
+        with pytest.raises(ValueError):
+            _ = tag.created_at
+        with pytest.raises(ValueError):
+            _ = tag.created_at
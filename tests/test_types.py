@@ -0,0 +1,25 @@
+"""Unit tests for Scambus SDK input types."""
+
+from scambus_client.types import StreamFilter, ViewFilter
+
+
+class TestFilterSerialization:
+    """Test the deprecated filter types' API payloads."""
+
+    def test_stream_filter_reflects_in_place_list_changes(self):
+        """Test to_dict picks up list fields mutated after an earlier call."""
+        stream_filter = StreamFilter(include_tags=["a"])
+        assert stream_filter.to_dict() == {"include_tags": ["a"]}
+
+        stream_filter.include_tags.append("b")
+
+        assert stream_filter.to_dict() == {"include_tags": ["a", "b"]}
+
+    def test_view_filter_reflects_in_place_list_changes(self):
+        """Test to_dict picks up entry types extended after an earlier call."""
+        view_filter = ViewFilter(entry_types=["note"])
+        view_filter.to_dict()
+
+        view_filter.entry_types.extend(["detection"])
+
+        assert view_filter.to_dict() == {"types": ["note", "detection"]}
@@ -0,0 +1,330 @@
+"""Unit tests for the Scambus WebSocket client."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from websockets.exceptions import ConnectionClosed
+from websockets.frames import Close
+
+from scambus_client import ScambusWebSocketClient, websocket_client
+from scambus_client.models import Identifier, JournalEntry
+from scambus_client.websocket_client import _backoff_schedule, _encode_subscribe
+
+
+@pytest.fixture
+def ws_client(mock_api_url, mock_api_key):
+    """Return a ScambusWebSocketClient that is never connected."""
+    return ScambusWebSocketClient(api_url=mock_api_url, api_token=mock_api_key)
+
+
+class TestWebSocketMessageHandling:
+    """Test inbound message dispatch."""
+
+    def test_event_handler_receives_data(self, ws_client):
+        """Test sync handlers receive the message data for their event."""
+        received = []
+        ws_client.on("notifications", "notification", received.append)
+
+        message = {"type": "event", "channel": "notifications", "event": "notification"}
+        message["data"] = {"title": "Hello"}
+        asyncio.run(ws_client._handle_message(json.dumps(message)))
+
+        assert received == [{"title": "Hello"}]
+
+    def test_binary_frame_parsed_without_decoding(self, ws_client):
+        """Test bytes frames are dispatched like text frames."""
+        received = []
+
+        async def handler(data):
+            received.append(data)
+
+        ws_client.on("notifications", "*", handler)
+
+        message = {"type": "event", "channel": "notifications", "event": "other", "data": {}}
+        asyncio.run(ws_client._handle_message(json.dumps(message).encode("utf-8")))
+
+        assert received == [message]
+
+    def test_heartbeat_skipped_before_parsing(self, ws_client, monkeypatch):
+        """Test heartbeat frames are dropped without being parsed."""
+        parsed = []
+        monkeypatch.setattr(websocket_client, "_json_loads", parsed.append)
+
+        asyncio.run(ws_client._handle_message('{"type":"heartbeat","timestamp":1}'))
+        asyncio.run(ws_client._handle_message(b'{"type":"heartbeat","timestamp":1}'))
+
+        assert parsed == []
+
+    @pytest.mark.parametrize(
+        "frame",
+        [
+            '{"type": "heartbeat", "timestamp": 1}',
+            b'{"timestamp":1,"type":"heartbeat"}',
+        ],
+    )
+    def test_non_compact_heartbeat_parsed_and_ignored(self, ws_client, frame):
+        """Test heartbeats that miss the prefix fast path reach no handlers."""
+        received = []
+        ws_client.on("notifications", "*", received.append)
+        ws_client.on("notifications", "notification", received.append)
+
+        asyncio.run(ws_client._handle_message(frame))
+
+        assert received == []
+
+    def test_failing_async_handler_does_not_block_others(self, ws_client):
+        """Test async handlers all run even when one of them raises."""
+        received = []
+
+        async def failing(data):
+            raise RuntimeError("boom")
+
+        async def handler(data):
+            received.append(data)
+
+        ws_client.on("notifications", "notification", failing)
+        ws_client.on("notifications", "notification", handler)
+
+        message = {"type": "event", "channel": "notifications", "event": "notification"}
+        message["data"] = {"title": "Hello"}
+        asyncio.run(ws_client._handle_message(json.dumps(message)))
+
+        assert received == [{"title": "Hello"}]
+
+    def test_stream_data_converted_to_model(self, ws_client, mock_identifier_data):
+        """Test stream channel data is converted to typed models."""
+        received = []
+        ws_client.on("stream:abc", "message", received.append)
+
+        message = {"type": "event", "channel": "stream:abc", "event": "message"}
+        message["data"] = dict(mock_identifier_data, display_value="scammer@example.com")
+        asyncio.run(ws_client._handle_message(json.dumps(message)))
+
+        assert isinstance(received[0], Identifier)
+        assert received[0].id == "ident-789"
+
+    def test_non_stream_data_not_converted(self, ws_client, mock_identifier_data):
+        """Test data on non-stream channels is passed through as a dict."""
+        received = []
+        ws_client.on("notifications", "notification", received.append)
+
+        message = {"type": "event", "channel": "notifications", "event": "notification"}
+        message["data"] = dict(mock_identifier_data, display_value="scammer@example.com")
+        asyncio.run(ws_client._handle_message(json.dumps(message)))
+
+        assert received == [message["data"]]
+
+    def test_stream_journal_entry_detected(self, ws_client):
+        """Test stream data with journal entry keys is converted to a JournalEntry."""
+        data = {"id": "entry-1", "type": "note", "performed_at": "2025-01-15T10:00:00Z"}
+
+        entry = ws_client._convert_stream_data(data, "stream:abc")
+
+        assert isinstance(entry, JournalEntry)
+        assert entry.id == "entry-1"
+
+    def test_unsubscribe_removes_handler(self, ws_client):
+        """Test the function returned by on() stops further dispatch."""
+        received = []
+        unsubscribe = ws_client.on("notifications", "notification", received.append)
+        unsubscribe()
+
+        message = {"type": "event", "channel": "notifications", "event": "notification"}
+        message["data"] = {"title": "Hello"}
+        asyncio.run(ws_client._handle_message(json.dumps(message)))
+
+        assert received == []
+        assert ("notifications", "notification") not in ws_client._dispatch
+
+    def test_handlers_run_in_registration_order(self, ws_client):
+        """Test mixed sync/async handlers run in order, event handlers before wildcards."""
+        received = []
+
+        async def async_handler(data):
+            await asyncio.sleep(0)
+            received.append("async")
+
+        ws_client.on("notifications", "*", lambda message: received.append("wildcard"))
+        ws_client.on("notifications", "notification", async_handler)
+        ws_client.on("notifications", "notification", lambda data: received.append("sync"))
+
+        message = {"type": "event", "channel": "notifications", "event": "notification"}
+        message["data"] = {"title": "Hello"}
+        asyncio.run(ws_client._handle_message(json.dumps(message)))
+
+        assert received == ["async", "sync", "wildcard"]
+
+    def test_handler_cancellation_propagates(self, ws_client):
+        """Test a BaseException from a handler is not swallowed by dispatch."""
+
+        async def cancelled(data):
+            raise asyncio.CancelledError()
+
+        ws_client.on("notifications", "notification", cancelled)
+
+        message = {"type": "event", "channel": "notifications", "event": "notification"}
+        message["data"] = {"title": "Hello"}
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(ws_client._handle_message(json.dumps(message)))
+
+    def test_handler_can_unsubscribe_itself(self, ws_client):
+        """Test a handler unsubscribing during dispatch does not skip other handlers."""
+        received = []
+
+        def once(data):
+            received.append("once")
+            unsubscribe()
+
+        unsubscribe = ws_client.on("notifications", "notification", once)
+        ws_client.on("notifications", "notification", lambda data: received.append("always"))
+
+        message = {"type": "event", "channel": "notifications", "event": "notification"}
+        message["data"] = {"title": "Hello"}
+        asyncio.run(ws_client._handle_message(json.dumps(message)))
+        asyncio.run(ws_client._handle_message(json.dumps(message)))
+
+        assert received == ["once", "always", "always"]
+
+
+class TestWebSocketListen:
+    """Test the listen_* convenience methods."""
+
+    @pytest.mark.parametrize("use_async", [False, True])
+    def test_listen_notifications_reports_run_errors(self, ws_client, use_async):
+        """Test on_error (sync or async) receives an exception escaping run()."""
+        errors = []
+        ws_client.run = AsyncMock(side_effect=RuntimeError("boom"))
+
+        if use_async:
+
+            async def on_error(e):
+                errors.append(e)
+
+        else:
+            on_error = errors.append
+
+        asyncio.run(ws_client.listen_notifications(lambda data: None, on_error=on_error))
+
+        assert [str(e) for e in errors] == ["boom"]
+
+
+class TestWebSocketControlMessages:
+    """Test outbound control messages."""
+
+    def test_subscribe_stream_sends_message(self, ws_client):
+        """Test subscribe_stream sends cursor and include_test for the stream channel."""
+        ws_client._ws = Mock(closed=False, send=AsyncMock())
+
+        asyncio.run(ws_client.subscribe_stream("abc", cursor="0-0"))
+
+        sent = ws_client._ws.send.call_args.args[0]
+        assert json.loads(sent) == {
+            "action": "subscribe",
+            "channel": "stream:abc",
+            "cursor": "0-0",
+            "include_test": False,
+        }
+
+    @pytest.mark.parametrize(
+        "streams",
+        [{"abc": "0-0", "def": "$"}, [("abc", "0-0"), ("def", "$")]],
+        ids=["mapping", "pairs"],
+    )
+    def test_subscribe_streams_sends_one_message_per_stream(self, ws_client, streams):
+        """Test subscribe_streams sends each stream's own cursor, in order."""
+        ws_client._ws = Mock(closed=False, send=AsyncMock())
+
+        asyncio.run(ws_client.subscribe_streams(streams, include_test=True))
+
+        sent = [json.loads(call.args[0]) for call in ws_client._ws.send.call_args_list]
+        assert [(msg["channel"], msg["cursor"]) for msg in sent] == [
+            ("stream:abc", "0-0"),
+            ("stream:def", "$"),
+        ]
+        assert all(msg["include_test"] for msg in sent)
+
+    @pytest.mark.parametrize("values", [(1, True), (True, 1)], ids=["int-first", "bool-first"])
+    def test_subscribe_encoding_keeps_include_test_type(self, values):
+        """Test equal-hashing include_test values of different types get their own payload."""
+        _encode_subscribe.cache_clear()
+
+        payloads = [json.loads(_encode_subscribe("abc", "0-0", value)) for value in values]
+
+        assert [type(payload["include_test"]) for payload in payloads] == [
+            type(value) for value in values
+        ]
+
+    def test_subscribe_streams_rejects_string(self, ws_client):
+        """Test a bare stream ID string is rejected instead of split into characters."""
+        ws_client._ws = Mock(closed=False, send=AsyncMock())
+
+        with pytest.raises(TypeError):
+            asyncio.run(ws_client.subscribe_streams("abc"))
+
+        ws_client._ws.send.assert_not_called()
+
+    def test_unsubscribe_stream_sends_message(self, ws_client):
+        """Test unsubscribe_stream sends the unsubscribe action for the stream channel."""
+        ws_client._ws = Mock(closed=False, send=AsyncMock())
+
+        asyncio.run(ws_client.unsubscribe_stream("abc"))
+
+        sent = ws_client._ws.send.call_args.args[0]
+        assert json.loads(sent) == {"action": "unsubscribe", "channel": "stream:abc"}
+
+
+class _ClosingConnection:
+    """Fake connection whose message iterator immediately raises ConnectionClosed."""
+
+    closed = False
+
+    def __init__(self, code):
+        self.code = code
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise ConnectionClosed(Close(self.code, ""), None)
+
+
+class TestWebSocketReconnect:
+    """Test reconnection backoff."""
+
+    def test_normal_closure_stops_without_reconnect(self, ws_client):
+        """Test close code 1000 ends run() without a reconnect attempt."""
+        ws_client._ws = _ClosingConnection(1000)
+        ws_client._reconnect = AsyncMock()
+
+        asyncio.run(ws_client.run())
+
+        ws_client._reconnect.assert_not_called()
+
+    def test_abnormal_closure_reconnects(self, ws_client):
+        """Test other close codes go through the reconnect backoff."""
+        ws_client._ws = _ClosingConnection(1006)
+        ws_client._reconnect = AsyncMock(return_value=False)
+
+        asyncio.run(ws_client.run())
+
+        ws_client._reconnect.assert_awaited_once()
+
+    def test_backoff_schedule_doubles_until_capped(self):
+        """Test the backoff schedule doubles per attempt and stops at the 60s cap."""
+        assert _backoff_schedule(1.0, 10) == (1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0)
+        assert _backoff_schedule(0.5, 3) == (0.5, 1.0, 2.0)
+
+    def test_reconnect_uses_current_backoff_settings(self, ws_client, monkeypatch):
+        """Test changing reconnect_delay after construction changes the backoff."""
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        monkeypatch.setattr("random.random", lambda: 0.0)
+        ws_client.connect = AsyncMock()
+        ws_client.reconnect_delay = 5.0
+        ws_client.reconnect_attempts = 1
+
+        assert asyncio.run(ws_client._reconnect()) is True
+
+        sleep.assert_awaited_once_with(10.0)